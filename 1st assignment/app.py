@@ -1,6 +1,7 @@
 from flask import Flask, render_template, request, jsonify
 import heapq
 import json
+from collections import deque
 
 app = Flask(__name__)
 
@@ -79,55 +80,81 @@ node_positions = {
     'B': {'x': 755, 'y': 175}
 }
 
+# The maze data never changes, so serialize it once at startup
+MAZE_GRAPH_JSON = json.dumps(maze_graph)
+NODE_POSITIONS_JSON = json.dumps(node_positions)
+MAZE_GRID_JSON = json.dumps(maze_grid)
+HEURISTIC_JSON = json.dumps(heuristic)
+
+def reconstruct_path(came_from, goal):
+    """Walk the parent pointers back from goal to rebuild the path"""
+    path = []
+    node = goal
+    while node is not None:
+        path.append(node)
+        node = came_from[node]
+    path.reverse()
+    return path
+
 def bfs(start, goal):
     """Breadth-First Search algorithm"""
-    queue = [(start, [start])]
-    visited = set([start])
+    queue = deque([start])
+    came_from = {start: None}
     all_explored = [start]
     
     while queue:
-        vertex, path = queue.pop(0)
+        vertex = queue.popleft()
         if vertex == goal:
-            return {'path': path, 'explored': all_explored}
+            return {'path': reconstruct_path(came_from, goal), 'explored': all_explored}
         
         for neighbor in maze_graph.get(vertex, {}):
-            if neighbor not in visited:
-                visited.add(neighbor)
+            if neighbor not in came_from:
+                came_from[neighbor] = vertex
                 all_explored.append(neighbor)
-                queue.append((neighbor, path + [neighbor]))
+                queue.append(neighbor)
     
     return {'path': [], 'explored': all_explored}
 
 def dfs(start, goal):
     """Depth-First Search algorithm"""
-    stack = [(start, [start])]
-    visited = set([start])
+    stack = [start]
+    came_from = {start: None}
     all_explored = [start]
     
     while stack:
-        vertex, path = stack.pop()
+        vertex = stack.pop()
         if vertex == goal:
-            return {'path': path, 'explored': all_explored}
+            return {'path': reconstruct_path(came_from, goal), 'explored': all_explored}
         
         for neighbor in reversed(list(maze_graph.get(vertex, {}))):
-            if neighbor not in visited:
-                visited.add(neighbor)
+            if neighbor not in came_from:
+                came_from[neighbor] = vertex
                 all_explored.append(neighbor)
-                stack.append((neighbor, path + [neighbor]))
+                stack.append(neighbor)
     
     return {'path': [], 'explored': all_explored}
 
 def a_star(start, goal):
     """A* Search algorithm"""
-    open_set = [(heuristic[start], 0, start, [start])]  # (f, g, node, path)
+    open_set = [(heuristic[start], 0, start)]  # (f, g, node)
     closed_set = set()
+    came_from = {start: None}
+    g_score = {start: 0}
     all_explored = [start]
+    explored_set = {start}  # mirrors all_explored for O(1) membership checks
+    # The last entry pushed by an expansion is held back and merged into the
+    # next pop with heappushpop, which saves one sift per expansion
+    pending = None
     
-    while open_set:
-        f, g, node, path = heapq.heappop(open_set)
+    while open_set or pending:
+        if pending:
+            f, g, node = heapq.heappushpop(open_set, pending)
+            pending = None
+        else:
+            f, g, node = heapq.heappop(open_set)
         
         if node == goal:
-            return {'path': path, 'explored': all_explored}
+            return {'path': reconstruct_path(came_from, goal), 'explored': all_explored}
         
         if node in closed_set:
             continue
@@ -138,23 +165,31 @@ def a_star(start, goal):
             if neighbor in closed_set:
                 continue
                 
-            if neighbor not in all_explored:
+            if neighbor not in explored_set:
+                explored_set.add(neighbor)
                 all_explored.append(neighbor)
                 
             new_g = g + maze_graph[node][neighbor]
+            if new_g >= g_score.get(neighbor, float('inf')):
+                continue
+            
+            came_from[neighbor] = node
+            g_score[neighbor] = new_g
             new_f = new_g + heuristic[neighbor]
             
-            heapq.heappush(open_set, (new_f, new_g, neighbor, path + [neighbor]))
+            if pending:
+                heapq.heappush(open_set, pending)
+            pending = (new_f, new_g, neighbor)
     
     return {'path': [], 'explored': all_explored}
 
 @app.route('/')
 def index():
     return render_template('index.html', 
-                         maze_structure=json.dumps(maze_graph),
-                         node_positions=json.dumps(node_positions),
-                         maze_grid=json.dumps(maze_grid),
-                         heuristic=json.dumps(heuristic))
+                         maze_structure=MAZE_GRAPH_JSON,
+                         node_positions=NODE_POSITIONS_JSON,
+                         maze_grid=MAZE_GRID_JSON,
+                         heuristic=HEURISTIC_JSON)
 
 
 @app.route('/solve', methods=['POST'])
@@ -1,748 +1,35 @@
 import dash
 import dash_bootstrap_components as dbc
 import dash_leaflet as dl
-from dash import html, dcc
-from dash.dependencies import Input, Output, State
+from dash import html, dcc, no_update
+from dash.dependencies import Input, Output, State, ClientsideFunction
 import time
 import heapq
 import osmnx as ox
 import numpy as np
+import orjson
+import plotly.io as pio
+from flask.json.provider import DefaultJSONProvider
+from scipy.spatial import cKDTree
+import shapely
 import os
+from collections import OrderedDict
 from functools import lru_cache
+from itertools import chain
 import logging
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Union, Any
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# =============================================================================
-# Graph and Geometry Setup
-# =============================================================================
-class GraphHandler:
-    def __init__(self, filename: str):
-        """Initialize the graph handler with a GraphML file.
-        
-        Args:
-            filename: Path to the GraphML file to load
-        """
-        self.graph = ox.load_graphml(filename)
-        self.node_coords = {n: (data['y'], data['x']) for n, data in self.graph.nodes(data=True)}
-        self._setup_edge_geometries()
-        
-    def _setup_edge_geometries(self) -> None:
-        """Set up edge geometries for faster lookup during visualization."""
-        self.edge_geometries_dict = {}
-
-        for u, v, k, data in self.graph.edges(keys=True, data=True):
-            try:
-                if 'geometry' in data:
-                    if hasattr(data['geometry'], 'coords'):
-                        coords = [
-                            (point[1], point[0]) if isinstance(point, tuple) else (point.y, point.x) 
-                            for point in data['geometry'].coords
-                        ]
-                    elif isinstance(data['geometry'], list):
-                        coords = [
-                            (point[1], point[0]) if isinstance(point, tuple) else (point.y, point.x) 
-                            for point in data['geometry']
-                        ]
-                    else:
-                        coords = [self.node_coords[u], self.node_coords[v]]
-                else:
-                    coords = [self.node_coords[u], self.node_coords[v]]
-                self.edge_geometries_dict[(u, v, k)] = tuple(coords)
-            except (AttributeError, IndexError, TypeError) as e:
-                logger.debug(f"Error processing edge geometry ({u}, {v}, {k}): {e}")
-                self.edge_geometries_dict[(u, v, k)] = (self.node_coords[u], self.node_coords[v])
-    
-    @lru_cache(maxsize=10000)
-    def get_edge_geometry(self, u: int, v: int) -> List[Tuple[float, float]]:
-        """Get geometry for edge between nodes u and v.
-        
-        Args:
-            u: Source node ID
-            v: Target node ID
-            
-        Returns:
-            List of (lat, lng) coordinates representing the edge geometry
-        """
-        for k in range(3):  # Most graphs won't have more than 3 parallel edges
-            if (u, v, k) in self.edge_geometries_dict:
-                return list(self.edge_geometries_dict[(u, v, k)])
-            if (v, u, k) in self.edge_geometries_dict:
-                return list(reversed(self.edge_geometries_dict[(v, u, k)]))
-        if u in self.node_coords and v in self.node_coords:
-            return [self.node_coords[u], self.node_coords[v]]
-        return []
-
-    def nearest_node(self, lng: float, lat: float) -> int:
-        """Find the nearest node to given coordinates.
-        
-        Args:
-            lng: Longitude
-            lat: Latitude
-            
-        Returns:
-            ID of the nearest node
-        """
-        return ox.distance.nearest_nodes(self.graph, X=lng, Y=lat)
-
-# =============================================================================
-# A* Search Algorithm
-# =============================================================================
-class AStarSearch:
-    def __init__(self, graph_handler: GraphHandler, heuristic_weight: float = 1.2):
-        """Initialize A* search with a graph handler.
-        
-        Args:
-            graph_handler: GraphHandler instance
-            heuristic_weight: Weight for the heuristic component of A* (default: 1.2)
-        """
-        self.graph_handler = graph_handler
-        self.heuristic_weight = heuristic_weight
-        
-    def search(self, start: int, goal: int) -> Tuple[Optional[List[int]], List[Tuple[int, int]], 
-                                                     List[int], List[List[Tuple[float, float]]],
-                                                     Optional[List[List[Tuple[float, float]]]]]:
-        """Perform A* search from start to goal.
-        
-        Args:
-            start: Start node ID
-            goal: Goal node ID
-            
-        Returns:
-            Tuple of (path, visited_edges, visited_nodes, edge_geometries, path_geometries)
-            where path is a list of node IDs or None if no path exists
-        """
-        graph = self.graph_handler.graph
-        node_coords = self.graph_handler.node_coords
-        get_edge_geometry = self.graph_handler.get_edge_geometry
-        
-        # Initialize data structures
-        open_set = [(0, start)]
-        visited = set()
-        g_score = {start: 0}
-        came_from = {}
-        
-        goal_y, goal_x = graph.nodes[goal]['y'], graph.nodes[goal]['x']
-        
-        visited_nodes = []
-        visited_edges = []
-        edge_geometries = []
-        
-        # Calculate heuristic for start node
-        start_h = ox.distance.great_circle(
-            graph.nodes[start]['y'], graph.nodes[start]['x'],
-            goal_y, goal_x
-        )
-        f_score = {start: start_h}
-        
-        # Main search loop
-        while open_set:
-            _, current = heapq.heappop(open_set)
-            if current in visited:
-                continue
-                
-            visited.add(current)
-            visited_nodes.append(current)
-            
-            # Goal check
-            if current == goal:
-                # Reconstruct path
-                path = [current]
-                while current in came_from:
-                    current = came_from[current]
-                    path.append(current)
-                path.reverse()
-                
-                # Get path geometries
-                path_geometries = []
-                for i in range(len(path) - 1):
-                    path_geometries.append(get_edge_geometry(path[i], path[i+1]))
-                return path, visited_edges, visited_nodes, edge_geometries, path_geometries
-            
-            # Process neighbors
-            for neighbor in graph.neighbors(current):
-                if neighbor in visited:
-                    continue
-                    
-                visited_edges.append((current, neighbor))
-                edge_geometries.append(get_edge_geometry(current, neighbor))
-                
-                # Get edge data and calculate new score
-                edge_data = graph.get_edge_data(current, neighbor)[0]
-                new_g = g_score[current] + edge_data.get("length", 1)
-                
-                # Update if we found a better path
-                if new_g < g_score.get(neighbor, float('inf')):
-                    came_from[neighbor] = current
-                    g_score[neighbor] = new_g
-                    
-                    # Calculate heuristic
-                    h = self.heuristic_weight * ox.distance.great_circle(
-                        graph.nodes[neighbor]['y'], graph.nodes[neighbor]['x'],
-                        goal_y, goal_x
-                    )
-                    f_score[neighbor] = new_g + h
-                    heapq.heappush(open_set, (f_score[neighbor], neighbor))
-        
-        # No path found
-        return None, visited_edges, visited_nodes, edge_geometries, None
-
-# =============================================================================
-# GeoJSON Helper Functions
-# =============================================================================
-class GeoJSONGenerator:
-    @staticmethod
-    def create_geojson_features(geometries: List[List[Tuple[float, float]]], 
-                              color: str = "red", 
-                              weight: int = 2, 
-                              opacity: float = 0.7) -> List[Dict[str, Any]]:
-        """Create GeoJSON features from geometries.
-        
-        Args:
-            geometries: List of geometries, each as a list of (lat, lng) coordinates
-            color: Line color
-            weight: Line weight
-            opacity: Line opacity
-            
-        Returns:
-            List of GeoJSON feature objects
-        """
-        features = []
-        for geom in geometries:
-            if not geom:
-                continue
-            coordinates = [[lng, lat] for lat, lng in geom]
-            feature = {
-                "type": "Feature",
-                "geometry": {"type": "LineString", "coordinates": coordinates},
-                "properties": {"color": color, "weight": weight, "opacity": opacity}
-            }
-            features.append(feature)
-        return features
-
-    @staticmethod
-    def create_geojson(geometries: List[List[Tuple[float, float]]], 
-                     color: str = "red", 
-                     weight: int = 2, 
-                     opacity: float = 0.7, 
-                     chunk_size: int = 200) -> List[Dict[str, Any]]:
-        """Create chunked GeoJSON objects from geometries.
-        
-        Args:
-            geometries: List of geometries, each as a list of (lat, lng) coordinates
-            color: Line color
-            weight: Line weight
-            opacity: Line opacity
-            chunk_size: Number of features per chunk
-            
-        Returns:
-            List of GeoJSON objects, chunked to reduce browser load
-        """
-        all_features = GeoJSONGenerator.create_geojson_features(geometries, color, weight, opacity)
-        chunked_geojsons = []
-        for i in range(0, len(all_features), chunk_size):
-            chunk = all_features[i:i + chunk_size]
-            chunked_geojsons.append({"type": "FeatureCollection", "features": chunk})
-        return chunked_geojsons
-
-# =============================================================================
-# App State Management
-# =============================================================================
-class AppState:
-    def __init__(self):
-        """Initialize application state."""
-        self.start_node = None
-        self.end_node = None
-        self.click_counter = 0
-        self.visited_edges = []
-        self.edge_geometries = []
-        self.path_geometries = []
-        self.chunked_geojsons = []
-        self.processed_chunks = 0
-        self.animation_complete = False
-        
-    def reset(self) -> None:
-        """Reset application state."""
-        self.start_node = None
-        self.end_node = None
-        self.click_counter = 0
-        self.visited_edges = []
-        self.edge_geometries = []
-        self.path_geometries = []
-        self.chunked_geojsons = []
-        self.processed_chunks = 0
-        self.animation_complete = False
-        
-    def get_search_data(self) -> Dict[str, Any]:
-        """Get current search data for the Dash store.
-        
-        Returns:
-            Dictionary of search data
-        """
-        return {
-            "edges_processed": min(self.processed_chunks * len(self.chunked_geojsons), len(self.visited_edges)) 
-                               if self.chunked_geojsons else 0,
-            "total_edges": len(self.visited_edges),
-            "path_found": bool(self.path_geometries),
-            "animation_complete": self.animation_complete
-        }
-
-# =============================================================================
-# Initialize App with Bootstrap
-# =============================================================================
-class PathfindingApp:
-    def __init__(self, graph_file: str, default_center: List[float], bounds: List[List[float]]):
-        """Initialize the A* pathfinding application.
-        
-        Args:
-            graph_file: Path to the GraphML file
-            default_center: Default map center [lat, lng]
-            bounds: Map bounds [[min_lat, min_lng], [max_lat, max_lng]]
-        """
-        self.external_stylesheets = [dbc.themes.BOOTSTRAP]
-        self.app = dash.Dash(__name__, 
-                           suppress_callback_exceptions=True, 
-                           external_stylesheets=self.external_stylesheets)
-        
-        # Initialize components
-        self.graph_handler = GraphHandler(graph_file)
-        self.astar = AStarSearch(self.graph_handler)
-        self.geojson_generator = GeoJSONGenerator()
-        self.state = AppState()
-        
-        # Map settings
-        self.default_center = default_center
-        self.bounds = bounds
-        
-        # Create the app layout
-        self._create_layout()
-        # Register callbacks
-        self._register_callbacks()
-        
-    def _create_layout(self) -> None:
-        """Create the app layout."""
-        self.app.layout = dbc.Container([
-            dbc.Row([
-                dbc.Col(html.H2("A* Search Map Visualization"), width=12)
-            ], className="mt-3"),
-            
-            dbc.Row([
-                dbc.Col(
-                    dl.Map([
-                        dl.TileLayer(),
-                        dl.LayerGroup(id="markers"),
-                        dl.LayerGroup(id="visited-edges-layer"),
-                        dl.LayerGroup(id="final-path-layer"),
-                        dl.LayerGroup(id="points-layer")
-                    ],
-                    id="map",
-                    center=self.default_center,
-                    maxBounds=self.bounds,
-                    zoom=12,
-                    minZoom=12,
-                    style={'width': '100%', 'height': '700px'}),
-                    xs=12, lg=8
-                ),
-                
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardHeader("Instructions"),
-                        dbc.CardBody([
-                            html.P("Click on the map to set the start (first click) and destination (second click) points.", 
-                                 className="card-text")
-                        ])
-                    ], className="mb-3"),
-                    
-                    dbc.Card([
-                        dbc.CardHeader("Actions"),
-                        dbc.CardBody([
-                            dbc.Button("Run Search", id="run-btn", color="primary", 
-                                     className="mb-2 me-2 btn-block"),
-                            dbc.Button("Clear Map", id="clear-btn", color="secondary", 
-                                     className="mb-2 btn-block")
-                        ])
-                    ], className="mb-3"),
-                    
-                    dbc.Card([
-                        dbc.CardHeader("Settings"),
-                        dbc.CardBody([
-                            html.Div([
-                                dbc.Label("Animation Speed"),
-                                dcc.Slider(
-                                    id="speed-slider",
-                                    min=500,
-                                    max=950,
-                                    step=50,
-                                    value=800,
-                                    marks={ 500: 'Slow', 750: 'Medium', 950: 'Fast (laggy)' }
-                                )
-                            ], className="mb-3"),
-                            html.Div([
-                                dbc.Label("Chunks Per Frame"),
-                                dcc.Slider(
-                                    id="chunks-per-frame-slider",
-                                    min=1,
-                                    max=5,
-                                    step=1,
-                                    value=1,
-                                    marks={1: '1', 5: '5'}
-                                )
-                            ], className="mb-3"),
-                            html.Div([
-                                dbc.Label("Chunk Size"),
-                                dcc.Slider(
-                                    id="chunk-size-slider",
-                                    min=1,
-                                    max=300,
-                                    step=50,
-                                    value=100,
-                                    marks={1: '1', 100: '100', 200: '200', 300: '300'}
-                                )
-                            ], className="mb-3"),
-                            html.Div([
-                                dbc.Label("Max Edges to Display"),
-                                dcc.Slider(
-                                    id="max-edges-slider",
-                                    min=1000,
-                                    max=20000,
-                                    step=1000,
-                                    value=5000,
-                                    marks={1000: '1K', 5000: '5K', 10000: '10K (laggy)', 20000: '20K (very laggy)'}
-                                )
-                            ], className="mb-3")
-                        ])
-                    ], className="mb-3"),
-                    
-                    dbc.Card([
-                        dbc.CardHeader("Status"),
-                        dbc.CardBody([
-                            html.Div(id="status", className="text-success")
-                        ])
-                    ])
-                ], xs=12, lg=4)
-            ], className="mt-3"),
-            
-            dcc.Interval(id="animation-interval", interval=200, n_intervals=0, disabled=True),
-            dcc.Store(id="search-data", data={
-                "edges_processed": 0,
-                "total_edges": 0,
-                "path_found": False,
-                "animation_complete": False
-            })
-        ], fluid=True)
-    
-    def _register_callbacks(self) -> None:
-        """Register all app callbacks."""
-        # Update animation interval based on speed slider
-        @self.app.callback(
-            Output("animation-interval", "interval"),
-            Input("speed-slider", "value")
-        )
-        def update_interval(value: int) -> int:
-            return 1000 - value
-
-        # Handle map clicks to set start/end points
-        @self.app.callback(
-            Output("markers", "children"),
-            Input("map", "clickData"),
-            State("markers", "children"),
-            prevent_initial_call=True
-        )
-        def handle_map_click(click_data: Dict[str, Any], markers: List) -> List:
-            if not click_data:
-                return markers or []
-            try:
-                lat = click_data.get('latlng', {}).get('lat')
-                lng = click_data.get('latlng', {}).get('lng')
-                if not (lat and lng):
-                    return markers or []
-                    
-                markers = markers or []
-                markers.append(dl.Marker(position=[lat, lng]))
-                self.state.click_counter += 1
-                
-                if self.state.click_counter == 1:
-                    self.state.start_node = self.graph_handler.nearest_node(lng, lat)
-                elif self.state.click_counter == 2:
-                    self.state.end_node = self.graph_handler.nearest_node(lng, lat)
-                elif self.state.click_counter > 2:
-                    # Reset start/end and begin new selection
-                    markers = [markers[-1]]
-                    self.state.start_node = self.graph_handler.nearest_node(lng, lat)
-                    self.state.end_node = None
-                    self.state.click_counter = 1
-                    
-                return markers
-            except Exception as e:
-                logger.error(f"Error handling map click: {e}")
-                return markers or []
-
-        # Clear the map and reset state
-        @self.app.callback(
-            [Output("markers", "children", allow_duplicate=True),
-             Output("visited-edges-layer", "children", allow_duplicate=True),
-             Output("final-path-layer", "children", allow_duplicate=True),
-             Output("points-layer", "children", allow_duplicate=True),
-             Output("status", "children", allow_duplicate=True),
-             Output("search-data", "data", allow_duplicate=True)],
-            Input("clear-btn", "n_clicks"),
-            prevent_initial_call=True
-        )
-        def clear_map(n_clicks: int) -> Tuple[List, List, List, List, str, Dict[str, Any]]:
-            if n_clicks > 0:
-                self.state.reset()
-                search_data = {
-                    "edges_processed": 0,
-                    "total_edges": 0,
-                    "path_found": False,
-                    "animation_complete": False
-                }
-                return [], [], [], [], "Map cleared. Click to set new points.", search_data
-            return [], [], [], [], "", {}
-
-        # Run the A* search
-        @self.app.callback(
-            [Output("status", "children"),
-             Output("animation-interval", "disabled"),
-             Output("points-layer", "children"),
-             Output("search-data", "data")],
-            [Input("run-btn", "n_clicks"),
-             Input("chunk-size-slider", "value"),
-             Input("max-edges-slider", "value")],
-            State("search-data", "data"),
-            prevent_initial_call=True
-        )
-        def run_search(n_clicks: int, chunk_size: int, max_edges: int, search_data: Dict[str, Any]) -> Tuple[str, bool, List, Dict[str, Any]]:
-            if n_clicks == 0 or not self.state.start_node or not self.state.end_node:
-                return "Set start and end points and click Run Search.", True, [], search_data
-                
-            # Reset state for new search
-            self.state.processed_chunks = 0
-            self.state.animation_complete = False
-            self.state.chunked_geojsons = []
-            
-            # Create markers for start/end nodes
-            points = []
-            if self.state.start_node in self.graph_handler.node_coords:
-                start_lat, start_lng = self.graph_handler.node_coords[self.state.start_node]
-                points.append(dl.CircleMarker(
-                    center=[start_lat, start_lng], radius=5,
-                    color="#007bff", fill=True, fillOpacity=1
-                ))
-            if self.state.end_node in self.graph_handler.node_coords:
-                end_lat, end_lng = self.graph_handler.node_coords[self.state.end_node]
-                points.append(dl.CircleMarker(
-                    center=[end_lat, end_lng], radius=5,
-                    color="green", fill=True, fillOpacity=1
-                ))
-                
-            # Run A* search
-            start_time = time.time()
-            path, edges, nodes, geom, path_geom = self.astar.search(
-                self.state.start_node, self.state.end_node
-            )
-            execution_time = time.time() - start_time
-
-            # Store actual edge count before sampling
-            actual_edge_count = len(edges) if edges else 0
-
-            # Sample edges for visualization if needed
-            if edges and actual_edge_count > max_edges:
-                sample_indices = np.linspace(0, actual_edge_count - 1, max_edges, dtype=int)
-                edges = [edges[i] for i in sample_indices]
-                geom = [geom[i] for i in sample_indices] if geom else []
-                
-            if path:
-                self.state.visited_edges = edges
-                self.state.edge_geometries = geom if geom else []
-                self.state.path_geometries = path_geom if path_geom else []
-                
-                # Generate GeoJSON chunks for animation
-                if self.state.edge_geometries:
-                    self.state.chunked_geojsons = self.geojson_generator.create_geojson(
-                        self.state.edge_geometries,
-                        color="red",
-                        weight=2,
-                        opacity=0.7,
-                        chunk_size=chunk_size
-                    )
-                    
-                updated_data = {
-                    "edges_processed": 0,
-                    "total_edges": actual_edge_count,
-                    "path_found": True,
-                    "animation_complete": False
-                }
-                
-                status_msg = (
-                    f"Path found with {len(path)} nodes, "
-                    f"explored {actual_edge_count} edges (displaying {len(self.state.visited_edges)}) "
-                    f"in {execution_time:.2f} seconds. Visualizing search process..."
-                )
-                return status_msg, False, points, updated_data
-            else:
-                updated_data = {
-                    "edges_processed": 0,
-                    "total_edges": actual_edge_count,
-                    "path_found": False,
-                    "animation_complete": True
-                }
-                return "No path found between selected points!", True, points, updated_data
-
-        # Update the visualization during animation
-        @self.app.callback(
-            [Output("visited-edges-layer", "children"),
-             Output("search-data", "data", allow_duplicate=True)],
-            [Input("animation-interval", "n_intervals"),
-             Input("chunk-size-slider", "value"),
-             Input("chunks-per-frame-slider", "value")],
-            State("search-data", "data"),
-            prevent_initial_call=True
-        )
-        def update_visualization(n_intervals: int, chunk_size: int, chunks_per_frame: int, 
-                                search_data: Dict[str, Any]) -> Tuple[List, Dict[str, Any]]:
-            if self.state.animation_complete or not self.state.chunked_geojsons:
-                return [], search_data
-                
-            total_edges = search_data.get("total_edges", 0)
-            try:
-                # Calculate how many chunks to show in this frame
-                chunks_to_show = min(
-                    len(self.state.chunked_geojsons),
-                    self.state.processed_chunks + chunks_per_frame
-                )
-                self.state.processed_chunks = chunks_to_show
-                
-                # Calculate how many edges have been processed
-                edges_processed = min(chunks_to_show * chunk_size, total_edges)
-                
-                # Check if animation is complete
-                self.state.animation_complete = chunks_to_show >= len(self.state.chunked_geojsons)
-                
-                # Create GeoJSON layers for visible chunks
-                geojson_layers = [
-                    dl.GeoJSON(
-                        data=self.state.chunked_geojsons[idx],
-                        id=f"visited-edges-{idx}",
-                        options={'style': {'color': '#007bff', 'weight': 2, 'opacity': 0.7}}
-                    )
-                    for idx in range(chunks_to_show)
-                ]
-                
-                updated_data = {
-                    "edges_processed": edges_processed,
-                    "total_edges": total_edges,
-                    "path_found": search_data.get("path_found", False),
-                    "animation_complete": self.state.animation_complete
-                }
-                
-                return geojson_layers, updated_data
-            except Exception as e:
-                logger.error(f"Error updating visualization: {e}")
-                return [], search_data
-
-        # Show the final path when animation is complete
-        @self.app.callback(
-            Output("final-path-layer", "children"),
-            [Input("animation-interval", "n_intervals"),
-             Input("search-data", "data")],
-            prevent_initial_call=True
-        )
-        def show_final_path(n_intervals: int, search_data: Dict[str, Any]) -> List:
-            animation_complete = search_data.get("animation_complete", False) or self.state.animation_complete
-            path_found = search_data.get("path_found", False)
-            
-            if animation_complete and path_found and self.state.path_geometries:
-                try:
-                    path_features = self.geojson_generator.create_geojson_features(
-                        self.state.path_geometries,
-                        color="green",
-                        weight=3,
-                        opacity=1.0
-                    )
-                    geojson_obj = {"type": "FeatureCollection", "features": path_features}
-                    return dl.GeoJSON(
-                        data=geojson_obj,
-                        id="final-path",
-                        options={'style': {'color': 'green', 'weight': 4, 'opacity': 1.0}}
-                    )
-                except Exception as e:
-                    logger.error(f"Error showing final path: {e}")
-                    return []
-            return []
-    
-    def run_server(self, **kwargs) -> None:
-        """Run the Dash server.
-        
-        Args:
-            **kwargs: Keyword arguments to pass to app.run_server()
-        """
-        self.app.run_server(**kwargs)
-
-# =============================================================================
-# Main Entry Point
-# =============================================================================
-# =============================================================================
-# Map Data Download and Initialization
-# =============================================================================
-def download_map_data(place_name: str = "Algiers, Algeria",
-                      network_type: str = "drive",
-                      filename: str = "algiers_graph.graphml") -> None:
-    """Download and save map data from OpenStreetMap.
-    Args:
-        place_name: Name of the area to download (default: "Algiers, Algeria")
-        network_type: Type of network ("drive", "walk", "bike", etc.)
-        filename: Output filename for the GraphML file
-    """
-    try:
-        logger.info(f"Downloading map data for {place_name}...")
-        # Download the street network
-        graph = ox.graph_from_place(place_name, network_type=network_type)
-        
-        # Try to simplify the graph if it's not already simplified
-        try:
-            if not graph.graph.get('simplified', False):
-                logger.info("Simplifying the graph...")
-                graph = ox.simplify_graph(graph)
-            else:
-                logger.info("Graph is already simplified, skipping simplification step.")
-        except Exception as simplify_error:
-            logger.warning(f"Could not simplify graph: {simplify_error}. Continuing with unsimplified graph.")
-        
-        # Save to GraphML file
-        ox.save_graphml(graph, filename)
-        logger.info(f"Map data saved to {filename}")
-    except Exception as e:
-        logger.error(f"Error downloading map data: {e}")
-        raise
-
-# =============================================================================
-# Main Entry Point with Map Initialization
-# =============================================================================
-if __name__ == '__main__':
-    # Configuration
-    MAP_DATA_FILE = "algiers_graph.graphml"
-    PLACE_NAME = "Algiers, Algeria"
-    import dash
-import dash_bootstrap_components as dbc
-import dash_leaflet as dl
-from dash import html, dcc
-from dash.dependencies import Input, Output, State
-import time
-import heapq
-import osmnx as ox
-import numpy as np
-import os
-from functools import lru_cache
-import logging
-from typing import Dict, List, Tuple, Optional, Any
+# Dash serializes callback payloads through plotly's JSON layer; pin it to orjson so
+# GeoJSON coordinate arrays are encoded straight from numpy buffers
+pio.json.config.default_engine = "orjson"
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
+# Douglas-Peucker tolerance (degrees, roughly 1 m) for the explored-edge geometries
+# drawn on the map; detail below this is invisible at the zoom levels the app uses
+EDGE_SIMPLIFY_TOLERANCE = 1e-5
 
 # =============================================================================
 # Graph and Geometry Setup
@@ -756,7 +43,46 @@ class GraphHandler:
         """
         self.graph = ox.load_graphml(filename)
         self.node_coords = {n: (data['y'], data['x']) for n, data in self.graph.nodes(data=True)}
+        self._setup_node_arrays()
+        self._setup_edge_lengths()
+        self._setup_adjacency()
         self._setup_edge_geometries()
+        self._setup_edge_arrays()
+        self._setup_spatial_index()
+        
+    def _setup_node_arrays(self) -> None:
+        """Set up dense node indices and struct-of-arrays node coordinates.
+        
+        ys/xs hold latitude/longitude in degrees, lat/lon the same values in
+        radians for the heuristic. All four are indexed by node_to_idx.
+        """
+        self.node_ids = list(self.node_coords)
+        self.node_to_idx = {n: i for i, n in enumerate(self.node_ids)}
+        n_nodes = len(self.node_ids)
+        self.ys = np.fromiter((y for y, _ in self.node_coords.values()), dtype=np.float64, count=n_nodes)
+        self.xs = np.fromiter((x for _, x in self.node_coords.values()), dtype=np.float64, count=n_nodes)
+        self.lat = np.deg2rad(self.ys)
+        self.lon = np.deg2rad(self.xs)
+        
+    def _setup_edge_lengths(self) -> None:
+        """Flatten edge lengths into a (u, v) lookup so A* avoids per-edge NetworkX traversal."""
+        self.edge_length = {
+            (u, v): data.get('length', 1)
+            for u, v, k, data in self.graph.edges(keys=True, data=True)
+            if k == 0
+        }
+        
+    def _setup_adjacency(self) -> None:
+        """Precompute each node's successors and matching edge lengths as tuples.
+        
+        adj_idx/adj_lengths_idx hold the same data keyed by dense node index
+        (node_to_idx) so the search can run on plain lists instead of dicts.
+        """
+        self.adj = {n: tuple(self.graph.neighbors(n)) for n in self.graph.nodes}
+        self.adj_lengths = {n: tuple(self.edge_length[(n, m)] for m in succ) for n, succ in self.adj.items()}
+        node_to_idx = self.node_to_idx
+        self.adj_idx = [tuple(node_to_idx[m] for m in self.adj[n]) for n in self.node_ids]
+        self.adj_lengths_idx = [self.adj_lengths[n] for n in self.node_ids]
         
     def _setup_edge_geometries(self) -> None:
         """Set up edge geometries for faster lookup during visualization."""
@@ -783,9 +109,71 @@ class GraphHandler:
             except (AttributeError, IndexError, TypeError) as e:
                 logger.debug(f"Error processing edge geometry ({u}, {v}, {k}): {e}")
                 self.edge_geometries_dict[(u, v, k)] = (self.node_coords[u], self.node_coords[v])
+        
+        # Store the reverse direction too, so lookups never reverse or copy at query time.
+        # Real edges take precedence over reversed ones with the same key.
+        for (u, v, k), coords in list(self.edge_geometries_dict.items()):
+            self.edge_geometries_dict.setdefault((v, u, k), coords[::-1])
     
+    def _setup_edge_arrays(self) -> None:
+        """Give every adjacency entry a dense edge ID and pack its geometry.
+        
+        adj_edge_ids_idx parallels adj_idx, and the (lng, lat) points of edge i are
+        edge_coords[edge_offsets[i]:edge_offsets[i + 1]]. These geometries are only used
+        for drawing, so they are simplified with EDGE_SIMPLIFY_TOLERANCE.
+        """
+        node_ids = self.node_ids
+        self.adj_edge_ids_idx = []
+        endpoints = []
+        for u_idx, succ in enumerate(self.adj_idx):
+            first = len(endpoints)
+            self.adj_edge_ids_idx.append(tuple(range(first, first + len(succ))))
+            u = node_ids[u_idx]
+            endpoints.extend((u, node_ids[v_idx]) for v_idx in succ)
+        
+        # Try key 0 directly first so this one-off pass does not churn get_edge_geometry's LRU
+        geometries = [self.edge_geometries_dict.get((u, v, 0)) or self.get_edge_geometry(u, v) for u, v in endpoints]
+        self.edge_offsets = np.zeros(len(geometries) + 1, dtype=np.int64)
+        np.cumsum([len(geom) for geom in geometries], out=self.edge_offsets[1:])
+        coords = np.fromiter(chain.from_iterable(chain.from_iterable(geometries)),
+                             dtype=np.float64, count=2 * int(self.edge_offsets[-1])).reshape(-1, 2)
+        
+        # Simplify every edge in one vectorized Shapely call; endpoints are always kept
+        lines = shapely.from_ragged_array(shapely.GeometryType.LINESTRING,
+                                          np.ascontiguousarray(coords[:, ::-1]), (self.edge_offsets,))
+        _, coords, (offsets,) = shapely.to_ragged_array(
+            shapely.simplify(lines, EDGE_SIMPLIFY_TOLERANCE, preserve_topology=False))
+        self.edge_coords = np.ascontiguousarray(coords)
+        self.edge_offsets = offsets.astype(np.int64, copy=False)
+        
+    def edge_ragged(self, edge_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Gather the geometries of several edges into one ragged buffer.
+        
+        Args:
+            edge_ids: Dense edge IDs (see _setup_edge_arrays)
+            
+        Returns:
+            Tuple of (coords_flat, offsets) in the same layout as
+            GeoJSONGenerator.to_ragged_array, with edges kept in the given order
+        """
+        starts = self.edge_offsets[edge_ids]
+        lengths = self.edge_offsets[edge_ids + 1] - starts
+        offsets = np.zeros(len(edge_ids) + 1, dtype=np.int32)
+        np.cumsum(lengths, out=offsets[1:])
+        point_idx = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+        return self.edge_coords[point_idx], offsets
+        
+    def _setup_spatial_index(self) -> None:
+        """Build a KD-tree over node coordinates once for nearest-node queries.
+        
+        Longitudes are scaled by cos(mean latitude) so that Euclidean distances in
+        the tree approximate ground distances at this map's latitude.
+        """
+        self._lng_scale = float(np.cos(np.deg2rad(self.ys.mean())))
+        self._tree = cKDTree(np.column_stack([self.xs * self._lng_scale, self.ys]))
+        
     @lru_cache(maxsize=10000)
-    def get_edge_geometry(self, u: int, v: int) -> List[Tuple[float, float]]:
+    def get_edge_geometry(self, u: int, v: int) -> Tuple[Tuple[float, float], ...]:
         """Get geometry for edge between nodes u and v.
         
         Args:
@@ -793,16 +181,30 @@ class GraphHandler:
             v: Target node ID
             
         Returns:
-            List of (lat, lng) coordinates representing the edge geometry
+            Tuple of (lat, lng) coordinates representing the edge geometry
         """
         for k in range(3):  # Most graphs won't have more than 3 parallel edges
-            if (u, v, k) in self.edge_geometries_dict:
-                return list(self.edge_geometries_dict[(u, v, k)])
-            if (v, u, k) in self.edge_geometries_dict:
-                return list(reversed(self.edge_geometries_dict[(v, u, k)]))
+            coords = self.edge_geometries_dict.get((u, v, k))
+            if coords is not None:
+                return coords
         if u in self.node_coords and v in self.node_coords:
-            return [self.node_coords[u], self.node_coords[v]]
-        return []
+            return (self.node_coords[u], self.node_coords[v])
+        return ()
+
+    def great_circle_batch(self, idxs: Any, goal_idx: int) -> np.ndarray:
+        """Compute great-circle distances from several nodes to the goal at once.
+        
+        Args:
+            idxs: Dense indices (or a slice) of the source nodes
+            goal_idx: Dense index of the goal node
+            
+        Returns:
+            Array of distances in meters, in the same order as idxs
+        """
+        lat, lon = self.lat[idxs], self.lon[idxs]
+        goal_lat, goal_lon = self.lat[goal_idx], self.lon[goal_idx]
+        h = np.sin((goal_lat - lat) / 2) ** 2 + np.cos(lat) * np.cos(goal_lat) * np.sin((goal_lon - lon) / 2) ** 2
+        return 2 * np.arcsin(np.sqrt(np.minimum(1, h))) * ox.distance.EARTH_RADIUS_M
 
     def nearest_node(self, lng: float, lat: float) -> int:
         """Find the nearest node to given coordinates.
@@ -814,7 +216,8 @@ class GraphHandler:
         Returns:
             ID of the nearest node
         """
-        return ox.distance.nearest_nodes(self.graph, X=lng, Y=lat)
+        _, i = self._tree.query([lng * self._lng_scale, lat])
+        return self.node_ids[i]
 
 # =============================================================================
 # A* Search Algorithm
@@ -829,9 +232,32 @@ class AStarSearch:
         """
         self.graph_handler = graph_handler
         self.heuristic_weight = heuristic_weight
+        # (goal index, heuristic table) for the most recent goal, swapped as one tuple so
+        # concurrent searches never pair a goal with another goal's table
+        self._h_cache: Optional[Tuple[int, List[float]]] = None
         
-    def search(self, start: int, goal: int) -> Tuple[Optional[List[int]], List[Tuple[int, int]], 
-                                                     List[int], List[List[Tuple[float, float]]],
+    def _precompute_h(self, goal_idx: int) -> List[float]:
+        """Build the weighted heuristic for every node towards a goal.
+        
+        The haversine runs once over the whole lat/lon arrays and the weight is
+        folded in, so the hot loop only indexes a list. The table for the most
+        recent goal is kept, since repeated searches often share a goal.
+        
+        Args:
+            goal_idx: Dense index of the goal node
+            
+        Returns:
+            List of heuristic_weight * distance-to-goal, indexed by dense node index
+        """
+        cache = self._h_cache
+        if cache is not None and cache[0] == goal_idx:
+            return cache[1]
+        h = self.graph_handler.great_circle_batch(slice(None), goal_idx)
+        table = (self.heuristic_weight * h).tolist()
+        self._h_cache = (goal_idx, table)
+        return table
+        
+    def search(self, start: int, goal: int) -> Tuple[Optional[List[int]], np.ndarray, List[int],
                                                      Optional[List[List[Tuple[float, float]]]]]:
         """Perform A* search from start to goal.
         
@@ -840,88 +266,129 @@ class AStarSearch:
             goal: Goal node ID
             
         Returns:
-            Tuple of (path, visited_edges, visited_nodes, edge_geometries, path_geometries)
-            where path is a list of node IDs or None if no path exists
+            Tuple of (path, visited_edges, visited_nodes, path_geometries) where path is
+            a list of node IDs or None if no path exists, and visited_edges is an int32
+            array of the dense edge IDs considered, in order; their endpoints and
+            geometries live in the GraphHandler edge arrays.
         """
-        graph = self.graph_handler.graph
-        node_coords = self.graph_handler.node_coords
         get_edge_geometry = self.graph_handler.get_edge_geometry
+        inf = float('inf')
+        
+        # Bind hot-loop callables to locals to skip repeated attribute lookups
+        heappush, heappop, heappushpop = heapq.heappush, heapq.heappop, heapq.heappushpop
+        adj = self.graph_handler.adj_idx
+        adj_lengths = self.graph_handler.adj_lengths_idx
+        adj_edge_ids = self.graph_handler.adj_edge_ids_idx
+        node_ids = self.graph_handler.node_ids
+        node_to_idx = self.graph_handler.node_to_idx
+        
+        # The search runs on dense node indices; per-node state lives in flat lists
+        # (cheaper to index from Python than numpy scalars) instead of dicts
+        n_nodes = len(node_ids)
+        start_idx = node_to_idx[start]
+        goal_idx = node_to_idx[goal]
         
         # Initialize data structures
-        open_set = [(0, start)]
-        visited = set()
-        g_score = {start: 0}
-        came_from = {}
-        
-        goal_y, goal_x = graph.nodes[goal]['y'], graph.nodes[goal]['x']
+        open_set = [(0, start_idx, 0)]  # (f, node index, version)
+        visited = bytearray(n_nodes)  # 1 byte per node, set to 1 once expanded
+        g_score = [inf] * n_nodes
+        g_score[start_idx] = 0
+        came_from = [-1] * n_nodes
+        # Heap entries are never removed when a node is improved; an entry whose
+        # version is older than the node's current one is stale and gets skipped
+        current_version = [0] * n_nodes
         
         visited_nodes = []
         visited_edges = []
-        edge_geometries = []
         
-        # Calculate heuristic for start node
-        start_h = ox.distance.great_circle(
-            graph.nodes[start]['y'], graph.nodes[start]['x'],
-            goal_y, goal_x
-        )
-        f_score = {start: start_h}
+        record_node = visited_nodes.append
+        record_edge = visited_edges.append
+        
+        h_table = self._precompute_h(goal_idx)
+        
+        # The last entry relaxed from each expansion is held back and merged into the
+        # next pop with heappushpop, saving one sift per expansion
+        pending = None
         
         # Main search loop
-        while open_set:
-            _, current = heapq.heappop(open_set)
-            if current in visited:
+        while open_set or pending:
+            if pending:
+                _, current, version = heappushpop(open_set, pending)
+                pending = None
+            else:
+                _, current, version = heappop(open_set)
+            if version != current_version[current]:
                 continue
                 
-            visited.add(current)
-            visited_nodes.append(current)
+            visited[current] = 1
+            current_id = node_ids[current]
+            record_node(current_id)
             
             # Goal check
-            if current == goal:
+            if current == goal_idx:
                 # Reconstruct path
-                path = [current]
-                while current in came_from:
+                path = [current_id]
+                while came_from[current] != -1:
                     current = came_from[current]
-                    path.append(current)
+                    path.append(node_ids[current])
                 path.reverse()
                 
                 # Get path geometries
                 path_geometries = []
                 for i in range(len(path) - 1):
                     path_geometries.append(get_edge_geometry(path[i], path[i+1]))
-                return path, visited_edges, visited_nodes, edge_geometries, path_geometries
+                return path, np.array(visited_edges, dtype=np.int32), visited_nodes, path_geometries
             
             # Process neighbors
-            for neighbor in graph.neighbors(current):
-                if neighbor in visited:
+            current_g = g_score[current]
+            for neighbor, length, edge_id in zip(adj[current], adj_lengths[current], adj_edge_ids[current]):
+                if visited[neighbor]:
                     continue
                     
-                visited_edges.append((current, neighbor))
-                edge_geometries.append(get_edge_geometry(current, neighbor))
+                record_edge(edge_id)
                 
-                # Get edge data and calculheuristic_weightate new score
-                edge_data = graph.get_edge_data(current, neighbor)[0]
-                new_g = g_score[current] + edge_data.get("length", 1)
+                new_g = current_g + length
                 
                 # Update if we found a better path
-                if new_g < g_score.get(neighbor, float('inf')):
+                if new_g < g_score[neighbor]:
                     came_from[neighbor] = current
                     g_score[neighbor] = new_g
                     
-                    # Calculate heuristic
-                    h = self.heuristic_weight * ox.distance.great_circle(
-                        graph.nodes[neighbor]['y'], graph.nodes[neighbor]['x'],
-                        goal_y, goal_x
-                    )
-                    f_score[neighbor] = new_g + h
-                    heapq.heappush(open_set, (f_score[neighbor], neighbor))
+                    version = current_version[neighbor] + 1
+                    current_version[neighbor] = version
+                    if pending:
+                        heappush(open_set, pending)
+                    pending = (new_g + h_table[neighbor], neighbor, version)
         
         # No path found
-        return None, visited_edges, visited_nodes, edge_geometries, None
+        return None, np.array(visited_edges, dtype=np.int32), visited_nodes, None
 
 # =============================================================================
 # GeoJSON Helper Functions
 # =============================================================================
 class GeoJSONGenerator:
+    @staticmethod
+    def to_ragged_array(geometries: List[List[Tuple[float, float]]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Pack geometries into one flat coordinate buffer plus offsets.
+        
+        Args:
+            geometries: List of geometries, each as a list of (lat, lng) coordinates
+            
+        Returns:
+            Tuple of (coords_flat, offsets) where coords_flat is a C-contiguous
+            (total_points, 2) float64 array in (lng, lat) order and geometry i
+            occupies coords_flat[offsets[i]:offsets[i + 1]]. Empty geometries are dropped.
+        """
+        geometries = [geom for geom in geometries if geom]
+        offsets = np.zeros(len(geometries) + 1, dtype=np.int32)
+        np.cumsum([len(geom) for geom in geometries], out=offsets[1:])
+        # Stream every coordinate straight into one buffer, skipping the intermediate
+        # list of points, then swap (lat, lng) -> (lng, lat) in a single copy
+        coords = np.fromiter(chain.from_iterable(chain.from_iterable(geometries)),
+                             dtype=np.float64, count=2 * int(offsets[-1])).reshape(-1, 2)
+        coords_flat = np.ascontiguousarray(coords[:, ::-1])
+        return coords_flat, offsets
+
     @staticmethod
     def create_geojson_features(geometries: List[List[Tuple[float, float]]], 
                               color: str = "red", 
@@ -936,45 +403,55 @@ class GeoJSONGenerator:
             opacity: Line opacity
             
         Returns:
-            List of GeoJSON feature objects
+            List of GeoJSON feature objects, with coordinates as (n, 2) float64 array views
         """
-        features = []
-        for geom in geometries:
-            if not geom:
-                continue
-            coordinates = [[lng, lat] for lat, lng in geom]
-            feature = {
+        coords_flat, offsets = GeoJSONGenerator.to_ragged_array(geometries)
+        properties = {"color": color, "weight": weight, "opacity": opacity}
+        bounds = offsets.tolist()
+        return [
+            {
                 "type": "Feature",
-                "geometry": {"type": "LineString", "coordinates": coordinates},
-                "properties": {"color": color, "weight": weight, "opacity": opacity}
+                "geometry": {"type": "LineString", "coordinates": coords_flat[a:b]},
+                "properties": properties
             }
-            features.append(feature)
-        return features
+            for a, b in zip(bounds[:-1], bounds[1:])
+        ]
 
     @staticmethod
-    def create_geojson(geometries: List[List[Tuple[float, float]]], 
-                     color: str = "red", 
-                     weight: int = 2, 
-                     opacity: float = 0.7, 
-                     chunk_size: int = 200) -> List[Dict[str, Any]]:
-        """Create chunked GeoJSON objects from geometries.
-        
+    def create_ragged_chunks(coords_flat: np.ndarray, 
+                             offsets: np.ndarray, 
+                             color: str = "red", 
+                             weight: int = 2, 
+                             opacity: float = 0.7, 
+                             chunk_size: int = 200) -> Dict[str, Any]:
+        """Describe chunked GeoJSON as one coordinate buffer for the browser to expand.
+        
+        Chunk k covers geometries k * chunk_size up to (k + 1) * chunk_size (the last
+        chunk may be shorter). assets/anim.js builds each chunk when it is first shown,
+        as a FeatureCollection holding a single MultiLineString feature with those
+        geometries' coordinates and the shared properties, so that every chunk is
+        one Leaflet layer.
+
         Args:
-            geometries: List of geometries, each as a list of (lat, lng) coordinates
+            coords_flat: (total_points, 2) float64 (lng, lat) buffer, as from to_ragged_array
+            offsets: Geometry offsets into coords_flat, as from to_ragged_array
             color: Line color
             weight: Line weight
             opacity: Line opacity
-            chunk_size: Number of features per chunk
+            chunk_size: Number of edge geometries per chunk
             
         Returns:
-            List of GeoJSON objects, chunked to reduce browser load
+            Dictionary with the (lng, lat) coordinate buffer, geometry offsets,
+            chunk size, number of chunks and the shared feature properties
         """
-        all_features = GeoJSONGenerator.create_geojson_features(geometries, color, weight, opacity)
-        chunked_geojsons = []
-        for i in range(0, len(all_features), chunk_size):
-            chunk = all_features[i:i + chunk_size]
-            chunked_geojsons.append({"type": "FeatureCollection", "features": chunk})
-        return chunked_geojsons
+        n_features = len(offsets) - 1
+        return {
+            "coordinates": coords_flat,
+            "offsets": offsets,
+            "chunk_size": chunk_size,
+            "num_chunks": -(-n_features // chunk_size),
+            "properties": {"color": color, "weight": weight, "opacity": opacity}
+        }
 
 # =============================================================================
 # App State Management
@@ -985,38 +462,38 @@ class AppState:
         self.start_node = None
         self.end_node = None
         self.click_counter = 0
-        self.visited_edges = []
-        self.edge_geometries = []
+        self.visited_edges = np.empty(0, dtype=np.int32)
         self.path_geometries = []
-        self.chunked_geojsons = []
-        self.processed_chunks = 0
-        self.animation_complete = False
+        self.edge_chunks = None
         
     def reset(self) -> None:
         """Reset application state."""
         self.start_node = None
         self.end_node = None
         self.click_counter = 0
-        self.visited_edges = []
-        self.edge_geometries = []
+        self.visited_edges = np.empty(0, dtype=np.int32)
         self.path_geometries = []
-        self.chunked_geojsons = []
-        self.processed_chunks = 0
-        self.animation_complete = False
-        
-    def get_search_data(self) -> Dict[str, Any]:
-        """Get current search data for the Dash store.
-        
-        Returns:
-            Dictionary of search data
-        """
-        return {
-            "edges_processed": min(self.processed_chunks * len(self.chunked_geojsons), len(self.visited_edges)) 
-                               if self.chunked_geojsons else 0,
-            "total_edges": len(self.visited_edges),
-            "path_found": bool(self.path_geometries),
-            "animation_complete": self.animation_complete
-        }
+        self.edge_chunks = None
+
+# =============================================================================
+# JSON Provider
+# =============================================================================
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+    
+    Covers the responses Dash builds with flask.jsonify (e.g. the callback
+    dependency list); callback payloads already go through plotly's orjson engine.
+    """
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
 
 # =============================================================================
 # Initialize App with Bootstrap
@@ -1031,15 +508,26 @@ class PathfindingApp:
             bounds: Map bounds [[min_lat, min_lng], [max_lat, max_lng]]
         """
         self.external_stylesheets = [dbc.themes.BOOTSTRAP]
+        # compress=True gzips/brotli-encodes responses via Flask-Compress; the packed
+        # edge coordinates in run_search's response compress several times over
         self.app = dash.Dash(__name__, 
                            suppress_callback_exceptions=True, 
-                           external_stylesheets=self.external_stylesheets)
+                           external_stylesheets=self.external_stylesheets,
+                           compress=True)
+        self.app.server.json = OrjsonProvider(self.app.server)
         
         # Initialize components
         self.graph_handler = GraphHandler(graph_file)
         self.astar = AStarSearch(self.graph_handler)
         self.geojson_generator = GeoJSONGenerator()
         self.state = AppState()
+        # Nearest node per click position, keyed on coordinates rounded to 5 decimals (~1 m),
+        # evicted least recently used first
+        self._click_cache: OrderedDict[Tuple[int, int], int] = OrderedDict()
+        self._click_cache_size = 1024
+        # Recent A* results keyed on (start_node, end_node), evicted least recently used first
+        self._search_cache: OrderedDict[Tuple[int, int], Tuple] = OrderedDict()
+        self._search_cache_size = 32
         
         # Map settings
         self.default_center = default_center
@@ -1050,6 +538,46 @@ class PathfindingApp:
         # Register callbacks
         self._register_callbacks()
         
+    def _nearest_node_for_click(self, lng: float, lat: float) -> int:
+        """Resolve a map click to the nearest graph node, reusing earlier nearby clicks.
+        
+        Args:
+            lng: Longitude of the click
+            lat: Latitude of the click
+            
+        Returns:
+            Node ID of the nearest node
+        """
+        key = (round(lng * 1e5), round(lat * 1e5))
+        node = self._click_cache.get(key)
+        if node is not None:
+            self._click_cache.move_to_end(key)
+            return node
+        node = self._click_cache[key] = self.graph_handler.nearest_node(lng, lat)
+        if len(self._click_cache) > self._click_cache_size:
+            self._click_cache.popitem(last=False)
+        return node
+        
+    def _cached_search(self, start: int, end: int) -> Tuple:
+        """Run A* from start to end, reusing the result of a recent identical query.
+        
+        Args:
+            start: Start node ID
+            end: End node ID
+            
+        Returns:
+            The AStarSearch.search result tuple
+        """
+        key = (start, end)
+        result = self._search_cache.get(key)
+        if result is not None:
+            self._search_cache.move_to_end(key)
+            return result
+        result = self._search_cache[key] = self.astar.search(start, end)
+        if len(self._search_cache) > self._search_cache_size:
+            self._search_cache.popitem(last=False)
+        return result
+        
     def _create_layout(self) -> None:
         """Create the app layout."""
         self.app.layout = dbc.Container([
@@ -1067,6 +595,8 @@ class PathfindingApp:
                         dl.LayerGroup(id="points-layer")
                     ],
                     id="map",
+                    # Draw vector layers on one canvas instead of an SVG node per edge
+                    preferCanvas=True,
                     center=self.default_center,
                     maxBounds=self.bounds,
                     zoom=12,
@@ -1154,12 +684,12 @@ class PathfindingApp:
             ], className="mt-3"),
             
             dcc.Interval(id="animation-interval", interval=200, n_intervals=0, disabled=True),
-            dcc.Store(id="search-data", data={
-                "edges_processed": 0,
-                "total_edges": 0,
-                "path_found": False,
-                "animation_complete": False
-            })
+            # Number of edge chunks shown so far, or -1 once there is nothing left to animate
+            dcc.Store(id="search-data", data=-1),
+            # Packed explored edges (see GeoJSONGenerator.create_ragged_chunks) and the
+            # final path, sent once per search and animated in the browser by assets/anim.js
+            dcc.Store(id="chunks-store", data=None),
+            dcc.Store(id="path-store", data=None)
         ], fluid=True)
     
     def _register_callbacks(self) -> None:
@@ -1179,27 +709,27 @@ class PathfindingApp:
             State("markers", "children"),
             prevent_initial_call=True
         )
-        def handle_map_click(click_data: Dict[str, Any], markers: List) -> List:
+        def handle_map_click(click_data: Dict[str, Any], markers: List) -> Any:
             if not click_data:
-                return markers or []
+                return no_update
             try:
                 lat = click_data.get('latlng', {}).get('lat')
                 lng = click_data.get('latlng', {}).get('lng')
                 if not (lat and lng):
-                    return markers or []
+                    return no_update
                     
                 markers = markers or []
                 markers.append(dl.Marker(position=[lat, lng]))
                 self.state.click_counter += 1
                 
                 if self.state.click_counter == 1:
-                    self.state.start_node = self.graph_handler.nearest_node(lng, lat)
+                    self.state.start_node = self._nearest_node_for_click(lng, lat)
                 elif self.state.click_counter == 2:
-                    self.state.end_node = self.graph_handler.nearest_node(lng, lat)
+                    self.state.end_node = self._nearest_node_for_click(lng, lat)
                 elif self.state.click_counter > 2:
                     # Reset start/end and begin new selection
                     markers = [markers[-1]]
-                    self.state.start_node = self.graph_handler.nearest_node(lng, lat)
+                    self.state.start_node = self._nearest_node_for_click(lng, lat)
                     self.state.end_node = None
                     self.state.click_counter = 1
                     
@@ -1215,42 +745,40 @@ class PathfindingApp:
              Output("final-path-layer", "children", allow_duplicate=True),
              Output("points-layer", "children", allow_duplicate=True),
              Output("status", "children", allow_duplicate=True),
-             Output("search-data", "data", allow_duplicate=True)],
+             Output("search-data", "data", allow_duplicate=True),
+             Output("chunks-store", "data", allow_duplicate=True),
+             Output("path-store", "data", allow_duplicate=True)],
             Input("clear-btn", "n_clicks"),
             prevent_initial_call=True
         )
-        def clear_map(n_clicks: int) -> Tuple[List, List, List, List, str, Dict[str, Any]]:
+        def clear_map(n_clicks: int) -> Tuple[Any, ...]:
             if n_clicks > 0:
                 self.state.reset()
-                search_data = {
-                    "edges_processed": 0,
-                    "total_edges": 0,
-                    "path_found": False,
-                    "animation_complete": False
-                }
-                return [], [], [], [], "Map cleared. Click to set new points.", search_data
-            return [], [], [], [], "", {}
+                return [], [], [], [], "Map cleared. Click to set new points.", -1, None, None
+            return (no_update,) * 8
 
         # Run the A* search
         @self.app.callback(
             [Output("status", "children"),
              Output("animation-interval", "disabled"),
              Output("points-layer", "children"),
-             Output("search-data", "data")],
+             Output("search-data", "data"),
+             Output("chunks-store", "data"),
+             Output("path-store", "data"),
+             Output("final-path-layer", "children", allow_duplicate=True)],
             [Input("run-btn", "n_clicks"),
              Input("chunk-size-slider", "value"),
              Input("max-edges-slider", "value")],
-            State("search-data", "data"),
             prevent_initial_call=True
         )
-        def run_search(n_clicks: int, chunk_size: int, max_edges: int, search_data: Dict[str, Any]) -> Tuple[str, bool, List, Dict[str, Any]]:
+        def run_search(n_clicks: int, chunk_size: int, max_edges: int) -> Tuple[Any, ...]:
             if n_clicks == 0 or not self.state.start_node or not self.state.end_node:
-                return "Set start and end points and click Run Search.", True, [], search_data
+                # Leave the layers and stores of any previous search untouched
+                return ("Set start and end points and click Run Search.", True,
+                        no_update, no_update, no_update, no_update, no_update)
                 
             # Reset state for new search
-            self.state.processed_chunks = 0
-            self.state.animation_complete = False
-            self.state.chunked_geojsons = []
+            self.state.edge_chunks = None
             
             # Create markers for start/end nodes
             points = []
@@ -1269,138 +797,72 @@ class PathfindingApp:
                 
             # Run A* search
             start_time = time.time()
-            path, edges, nodes, geom, path_geom = self.astar.search(
+            path, edges, nodes, path_geom = self._cached_search(
                 self.state.start_node, self.state.end_node
             )
             execution_time = time.time() - start_time
 
             # Store actual edge count before sampling
-            actual_edge_count = len(edges) if edges else 0
+            actual_edge_count = len(edges)
 
             # Sample edges for visualization if needed
-            if edges and actual_edge_count > max_edges:
+            if actual_edge_count > max_edges:
                 sample_indices = np.linspace(0, actual_edge_count - 1, max_edges, dtype=int)
-                edges = [edges[i] for i in sample_indices]
-                geom = [geom[i] for i in sample_indices] if geom else []
+                edges = edges[sample_indices]
                 
             if path:
                 self.state.visited_edges = edges
-                self.state.edge_geometries = geom if geom else []
                 self.state.path_geometries = path_geom if path_geom else []
                 
-                # Generate GeoJSON chunks for animation
-                if self.state.edge_geometries:
-                    self.state.chunked_geojsons = self.geojson_generator.create_geojson(
-                        self.state.edge_geometries,
+                # Pack the edges for animation; the browser builds each chunk when it is shown
+                if len(edges):
+                    self.state.edge_chunks = self.geojson_generator.create_ragged_chunks(
+                        *self.graph_handler.edge_ragged(edges),
                         color="red",
                         weight=2,
                         opacity=0.7,
                         chunk_size=chunk_size
                     )
-                    
-                updated_data = {
-                    "edges_processed": 0,
-                    "total_edges": actual_edge_count,
-                    "path_found": True,
-                    "animation_complete": False
-                }
                 
+                # The final path is drawn by the animation tick once every chunk is shown
+                path_geojson = None
+                if self.state.path_geometries:
+                    path_geojson = {
+                        "type": "FeatureCollection",
+                        "features": self.geojson_generator.create_geojson_features(
+                            self.state.path_geometries,
+                            color="green",
+                            weight=3,
+                            opacity=1.0
+                        )
+                    }
+                    
                 status_msg = (
                     f"Path found with {len(path)} nodes, "
                     f"explored {actual_edge_count} edges (displaying {len(self.state.visited_edges)}) "
                     f"in {execution_time:.2f} seconds. Visualizing search process..."
                 )
-                return status_msg, False, points, updated_data
+                # Restart the animation from the first chunk
+                return status_msg, False, points, 0, self.state.edge_chunks, path_geojson, []
             else:
-                updated_data = {
-                    "edges_processed": 0,
-                    "total_edges": actual_edge_count,
-                    "path_found": False,
-                    "animation_complete": True
-                }
-                return "No path found between selected points!", True, points, updated_data
+                return "No path found between selected points!", True, points, -1, None, None, []
 
-        # Update the visualization during animation
-        @self.app.callback(
+        # Animate the explored edges in the browser and draw the final path once
+        # they are all shown; each tick only slices the chunks already held in
+        # chunks-store, so no request reaches the server
+        self.app.clientside_callback(
+            ClientsideFunction(namespace="anim", function_name="tick"),
             [Output("visited-edges-layer", "children"),
-             Output("search-data", "data", allow_duplicate=True)],
+             Output("final-path-layer", "children", allow_duplicate=True),
+             Output("search-data", "data", allow_duplicate=True),
+             Output("animation-interval", "disabled", allow_duplicate=True)],
             [Input("animation-interval", "n_intervals"),
-             Input("chunk-size-slider", "value"),
              Input("chunks-per-frame-slider", "value")],
-            State("search-data", "data"),
+            [State("chunks-store", "data"),
+             State("path-store", "data"),
+             State("search-data", "data")],
             prevent_initial_call=True
         )
-        def update_visualization(n_intervals: int, chunk_size: int, chunks_per_frame: int, 
-                                search_data: Dict[str, Any]) -> Tuple[List, Dict[str, Any]]:
-            if self.state.animation_complete or not self.state.chunked_geojsons:
-                return [], search_data
-                
-            total_edges = search_data.get("total_edges", 0)
-            try:
-                # Calculate how many chunks to show in this frame
-                chunks_to_show = min(
-                    len(self.state.chunked_geojsons),
-                    self.state.processed_chunks + chunks_per_frame
-                )
-                self.state.processed_chunks = chunks_to_show
-                
-                # Calculate how many edges have been processed
-                edges_processed = min(chunks_to_show * chunk_size, total_edges)
-                
-                # Check if animation is complete
-                self.state.animation_complete = chunks_to_show >= len(self.state.chunked_geojsons)
-                
-                # Create GeoJSON layers for visible chunks
-                geojson_layers = [
-                    dl.GeoJSON(
-                        data=self.state.chunked_geojsons[idx],
-                        id=f"visited-edges-{idx}",
-                        options={'style': {'color': '#007bff', 'weight': 2, 'opacity': 0.7}}
-                    )
-                    for idx in range(chunks_to_show)
-                ]
-                
-                updated_data = {
-                    "edges_processed": edges_processed,
-                    "total_edges": total_edges,
-                    "path_found": search_data.get("path_found", False),
-                    "animation_complete": self.state.animation_complete
-                }
-                
-                return geojson_layers, updated_data
-            except Exception as e:
-                logger.error(f"Error updating visualization: {e}")
-                return [], search_data
-
-        # Show the final path when animation is complete
-        @self.app.callback(
-            Output("final-path-layer", "children"),
-            [Input("animation-interval", "n_intervals"),
-             Input("search-data", "data")],
-            prevent_initial_call=True
-        )
-        def show_final_path(n_intervals: int, search_data: Dict[str, Any]) -> List:
-            animation_complete = search_data.get("animation_complete", False) or self.state.animation_complete
-            path_found = search_data.get("path_found", False)
-            
-            if animation_complete and path_found and self.state.path_geometries:
-                try:
-                    path_features = self.geojson_generator.create_geojson_features(
-                        self.state.path_geometries,
-                        color="green",
-                        weight=3,
-                        opacity=1.0
-                    )
-                    geojson_obj = {"type": "FeatureCollection", "features": path_features}
-                    return dl.GeoJSON(
-                        data=geojson_obj,
-                        id="final-path",
-                        options={'style': {'color': 'green', 'weight': 4, 'opacity': 1.0}}
-                    )
-                except Exception as e:
-                    logger.error(f"Error showing final path: {e}")
-                    return []
-            return []
     
     def run_server(self, **kwargs) -> None:
         """Run the Dash server.
@@ -1453,6 +915,7 @@ def download_map_data(place_name: str = "Algiers, Algeria",
 if __name__ == '__main__':
     # Configuration
     MAP_DATA_FILE = "algiers_graph.graphml"
+    BOUNDS_FILE = os.path.splitext(MAP_DATA_FILE)[0] + ".bounds-cache.npy"
     PLACE_NAME = "Algiers, Algeria"
     
     # Check if map data exists, download if not
@@ -1470,46 +933,28 @@ if __name__ == '__main__':
                 logger.error(f"Fallback download also failed: {fallback_error}")
                 exit(1)
     
-    # Calculate map bounds from the downloaded data
+    # Calculate map bounds from the downloaded data, cached so a restart does not
+    # parse the whole GraphML a second time just for four numbers
     try:
-        graph = ox.load_graphml(MAP_DATA_FILE)
-        nodes = ox.graph_to_gdfs(graph, edges=False)
-        min_lat, min_lng = nodes['y'].min(), nodes['x'].min()
-        max_lat, max_lng = nodes['y'].max(), nodes['x'].max()
-        bounds = [[min_lat, min_lng], [max_lat, max_lng]]
-        default_center = [(min_lat + max_lat)/2, (min_lng + max_lng)/2]
-        
-        # Create and run the app
-        app = PathfindingApp(
-            graph_file=MAP_DATA_FILE,
-            default_center=default_center,
-            bounds=bounds
-        )
-        app.run_server(debug=False)
-    except Exception as e:
-        logger.error(f"Error initializing application: {e}")
-        exit(1)
-    # Check if map data exists, download if not
-    if not os.path.exists(MAP_DATA_FILE):
-        logger.info("Map data not found. Downloading...")
-        try:
-            download_map_data(place_name=PLACE_NAME, filename=MAP_DATA_FILE)
-        except Exception as e:
-            logger.error(f"Failed to download map data: {e}")
-            logger.info("Using a smaller area as fallback...")
+        cached_bounds = None
+        if (os.path.exists(BOUNDS_FILE) 
+                and os.path.getmtime(BOUNDS_FILE) >= os.path.getmtime(MAP_DATA_FILE)):
             try:
-                # Try with a more specific or smaller area
-                download_map_data(place_name="Downtown Algiers, Algeria", filename=MAP_DATA_FILE)
-            except Exception as fallback_error:
-                logger.error(f"Fallback download also failed: {fallback_error}")
-                exit(1)
-    
-    # Calculate map bounds from the downloaded data
-    try:
-        graph = ox.load_graphml(MAP_DATA_FILE)
-        nodes = ox.graph_to_gdfs(graph, edges=False)
-        min_lat, min_lng = nodes['y'].min(), nodes['x'].min()
-        max_lat, max_lng = nodes['y'].max(), nodes['x'].max()
+                cached_bounds = np.load(BOUNDS_FILE).tolist()
+                min_lat, min_lng, max_lat, max_lng = cached_bounds
+            except (OSError, ValueError, EOFError) as cache_error:
+                logger.warning(f"Ignoring unreadable bounds cache {BOUNDS_FILE}: {cache_error}")
+                cached_bounds = None
+        if cached_bounds is None:
+            graph = ox.load_graphml(MAP_DATA_FILE)
+            nodes = ox.graph_to_gdfs(graph, edges=False)
+            min_lat, min_lng = nodes['y'].min(), nodes['x'].min()
+            max_lat, max_lng = nodes['y'].max(), nodes['x'].max()
+            # The cache is only an optimization; a failed write must not stop startup
+            try:
+                np.save(BOUNDS_FILE, np.array([min_lat, min_lng, max_lat, max_lng], dtype=np.float64))
+            except OSError as cache_error:
+                logger.warning(f"Could not write bounds cache {BOUNDS_FILE}: {cache_error}")
         bounds = [[min_lat, min_lng], [max_lat, max_lng]]
         default_center = [(min_lat + max_lat)/2, (min_lng + max_lng)/2]
         
@@ -1522,4 +967,4 @@ if __name__ == '__main__':
         app.run_server(debug=False)
     except Exception as e:
         logger.error(f"Error initializing application: {e}")
-        exit(1)
\ No newline at end of file
+        exit(1)
@@ -0,0 +1,86 @@
+// Clientside animation of the explored edges (see PathfindingApp._register_callbacks).
+// The packed edges (GeoJSONGenerator.create_ragged_chunks) and the final path arrive once
+// per search in chunks-store and path-store; every tick builds and reveals the next
+// chunks, and the final path is drawn on the tick that shows the last chunk. search-data
+// only holds the number of chunks shown so far, or -1 once the animation is over.
+
+// Layer objects built so far for the current chunks, reused across ticks so each
+// chunk is expanded once per search and React sees unchanged children
+let cachedChunks = null;
+let cachedLayers = [];
+
+// Expand chunk k of the packed edges into a single MultiLineString feature, so Leaflet
+// keeps one layer per chunk instead of one per edge
+function buildChunk(chunks, k) {
+    const coords = chunks.coordinates;
+    const offsets = chunks.offsets;
+    const start = k * chunks.chunk_size;
+    const stop = Math.min(start + chunks.chunk_size, offsets.length - 1);
+    const lines = [];
+    for (let i = start; i < stop; i++) {
+        lines.push(coords.slice(offsets[i], offsets[i + 1]));
+    }
+    return {
+        type: 'FeatureCollection',
+        features: [{
+            type: 'Feature',
+            geometry: {type: 'MultiLineString', coordinates: lines},
+            properties: chunks.properties
+        }]
+    };
+}
+
+function edgeLayer(data, idx) {
+    return {
+        namespace: 'dash_leaflet',
+        type: 'GeoJSON',
+        props: {
+            data: data,
+            id: 'visited-edges-' + idx,
+            options: {style: {color: '#007bff', weight: 2, opacity: 0.7}}
+        }
+    };
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    anim: {
+        tick: function (nIntervals, chunksPerFrame, chunks, path, processedChunks) {
+            const noUpdate = window.dash_clientside.no_update;
+            if (processedChunks == null || processedChunks < 0) {
+                return [noUpdate, noUpdate, noUpdate, true];
+            }
+            const numChunks = chunks ? chunks.num_chunks : 0;
+
+            // Calculate how many chunks to show in this frame
+            const chunksToShow = Math.min(numChunks, processedChunks + chunksPerFrame);
+            const animationComplete = chunksToShow >= numChunks;
+
+            // Create GeoJSON layers for newly visible chunks only
+            if (chunks !== cachedChunks) {
+                cachedChunks = chunks;
+                cachedLayers = [];
+            }
+            for (let idx = cachedLayers.length; idx < chunksToShow; idx++) {
+                cachedLayers.push(edgeLayer(buildChunk(chunks, idx), idx));
+            }
+            const layers = cachedLayers.slice(0, chunksToShow);
+
+            // Show the final path when animation is complete
+            let pathLayer = noUpdate;
+            if (animationComplete && path) {
+                pathLayer = {
+                    namespace: 'dash_leaflet',
+                    type: 'GeoJSON',
+                    props: {
+                        data: path,
+                        id: 'final-path',
+                        options: {style: {color: 'green', weight: 4, opacity: 1.0}}
+                    }
+                };
+            }
+
+            // Stop ticking once everything is on the map
+            return [layers, pathLayer, animationComplete ? -1 : chunksToShow, animationComplete];
+        }
+    }
+});
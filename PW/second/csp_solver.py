@@ -1,3 +1,10 @@
+from collections import Counter, deque
+
+# Inside the solver a time slot is an integer id, day index * SLOT_STRIDE + slot number,
+# so domains, comparisons and dict lookups work on plain ints. Slot numbers stay below
+# SLOT_STRIDE, so id // SLOT_STRIDE is the day index and id % SLOT_STRIDE the slot
+SLOT_STRIDE = 8
+
 class Course:
     def __init__(self, name, teacher, has_lecture=True, has_td=True, has_tp=False, 
                  tp_teachers=None, td_teacher=None):
@@ -33,7 +40,7 @@ class Session:
         self.session_type = session_type  
         self.teacher = teacher
         self.group = group  
-        self.assigned_slot = None
+        self.assigned_slot = None  # time slot id during the search
 
     # String representation 
     def __str__(self):
@@ -78,42 +85,87 @@ class CSPSolver:
                     teacher_index = i % len(course.tp_teachers)
                     tp_teacher = course.tp_teachers[teacher_index]
                     self.sessions.append(Session(course, "tp", tp_teacher, group))
+        self.initialize_constraints()
         return self.sessions
     
     def initialize_domains(self):
         # For each session, initialize its domain (possible timeslots)
-        self.domains = {}
-        for session in self.sessions:
-            domain = []
-            for day in self.days:
-                for slot in range(1, self.slots_per_day[day] + 1):
-                    domain.append(TimeSlot(day, slot))
-            self.domains[session] = domain
-        print("Initial domains:")
-        for session, domain in self.domains.items():
-            print(f"{session}: {[str(slot) for slot in domain]}")
+        # Every session starts with the same timeslots, so build them once; each session
+        # gets its own copy since AC-3 prunes domains independently
+        domain = [day_index * SLOT_STRIDE + slot
+                  for day_index, day in enumerate(self.days)
+                  for slot in range(1, self.slots_per_day[day] + 1)]
+        self.domains = {session: domain.copy() for session in self.sessions}
         return self.domains
 
+    def time_slot(self, slot_id):
+        # TimeSlot for an integer time slot id
+        return TimeSlot(self.days[slot_id // SLOT_STRIDE], slot_id % SLOT_STRIDE)
+
+    def initialize_constraints(self):
+        # Constraint kinds of every pair of sessions that share a constraint, and each
+        # session's neighbours; any other pair is consistent whatever their time slots
+        self.constraints = {}
+        self.neighbours = {xi: [] for xi in self.sessions}
+        for xi in self.sessions:
+            for xj in self.sessions:
+                if xj != xi:
+                    kinds = self.constraint_kinds(xi, xj)
+                    if any(kinds):
+                        self.constraints[xi, xj] = kinds
+                        self.neighbours[xi].append(xj)
+        return self.constraints
+
+    def constraint_kinds(self, session_i, session_j):
+        # Which checks apply to a pair of sessions: clashing when given the same time slot,
+        # and clashing when given the same slot number on any day
+        same_time = bool(
+            # C5: Prevent same group having two courses at same time
+            (session_i.group and session_i.group == session_j.group) or
+            # Prevent same teacher teaching two sessions at same time
+            session_i.teacher == session_j.teacher or
+            # Prevent lectures overlapping with any other session
+            session_i.session_type == "lecture" or session_j.session_type == "lecture")
+        # C4: Prevent same course having multiple sessions in same slot
+        same_slot = (session_i.course == session_j.course and
+                     session_i.session_type == session_j.session_type and
+                     session_i.group == session_j.group)
+        return same_time, same_slot
+
     def ac3(self):
-        queue = [(xi, xj) for xi in self.sessions for xj in self.sessions if xi != xj]
+        queue = deque((xi, xj) for xi in self.sessions for xj in self.neighbours[xi])
         while queue:
-            (xi, xj) = queue.pop(0)
+            (xi, xj) = queue.popleft()
             if self.revise(xi, xj):
                 if len(self.domains[xi]) == 0:
                     return False
-                for xk in [x for x in self.sessions if x != xi and x != xj]:
-                    queue.append((xk, xi))  
-                    
+                # Only arcs into xi can lose support when xi's domain shrinks
+                for xk in self.neighbours[xi]:
+                    if xk != xj:
+                        queue.append((xk, xi))
 
         return True
 
     def revise(self, xi, xj):
         revised = False
         to_remove = []
+        domain_j = self.domains[xj]
+        # Decide the kind of constraint once per arc instead of calling is_consistent
+        # for every pair of values: a value of xi keeps its support as long as xj has
+        # some value that does not clash with it
+        same_time, same_slot = self.constraints.get((xi, xj), (False, False))
+        slots_j = {time_slot % SLOT_STRIDE for time_slot in domain_j}
         
         for time_slot_i in self.domains[xi]:
-            if not any(self.is_consistent(xi, time_slot_i, xj, time_slot_j) 
-                        for time_slot_j in self.domains[xj]):
+            if not domain_j:
+                supported = False
+            elif same_slot:
+                supported = len(slots_j) > 1 or time_slot_i % SLOT_STRIDE not in slots_j
+            elif same_time:
+                supported = len(domain_j) > 1 or time_slot_i not in domain_j
+            else:
+                supported = True
+            if not supported:
                 to_remove.append(time_slot_i)
                 revised = True
         
@@ -123,28 +175,23 @@ class CSPSolver:
         return revised
 
     def is_consistent(self, session_i, time_slot_i, session_j, time_slot_j):
-        if time_slot_i == time_slot_j:
-            # C5: Prevent same group having two courses at same time
-            if session_i.group and session_j.group and session_i.group == session_j.group:
-                return False
-            # Prevent same teacher teaching two sessions at same time
-            if session_i.teacher == session_j.teacher:
-                return False
-            # Prevent lectures overlapping with any other session
-            if session_i.session_type == "lecture" or session_j.session_type == "lecture":
-                return False
-
-        # C4: Prevent same course having multiple sessions in same slot
-        if (session_i.course == session_j.course and 
-            session_i.session_type == session_j.session_type and 
-            session_i.group == session_j.group and
-            time_slot_i.slot == time_slot_j.slot):
-            return False
-
+        same_time, same_slot = self.constraints.get((session_i, session_j), (False, False))
+        # A same slot number clash includes a same time clash
+        if same_slot:
+            return time_slot_i % SLOT_STRIDE != time_slot_j % SLOT_STRIDE
+        if same_time:
+            return time_slot_i != time_slot_j
         return True
 
     def backtracking_search(self):
         # Implement backtracking search
+        # Domains no longer change from here on, so conflict counts can be cached
+        self.conflict_counts = {}
+        # C3: occupied slots per (teacher, day), per (group, day) and per day, kept up to date
+        # as sessions are assigned and unassigned
+        self.teacher_slots = {}
+        self.group_slots = {}
+        self.day_slots = {}
         return self.backtrack({})
 
     def backtrack(self, assignment):
@@ -158,9 +205,11 @@ class CSPSolver:
             if self.is_value_consistent(var, value, assignment):
                 assignment[var] = value
                 var.assigned_slot = value
+                self.add_occupied_slot(var, value)
 
                 # C3: Check for 4+ consecutive slots
-                if not self.check_consecutive_sessions(assignment):
+                if not self.check_consecutive_sessions(var, value):
+                    self.remove_occupied_slot(var, value)
                     del assignment[var]
                     var.assigned_slot = None
                     continue
@@ -169,6 +218,7 @@ class CSPSolver:
                 if result:
                     return result
                 
+                self.remove_occupied_slot(var, value)
                 del assignment[var]
                 var.assigned_slot = None
         
@@ -176,108 +226,70 @@ class CSPSolver:
 
     def order_domain_values(self, var, assignment):
         # LCV heuristic: order domain values by how constraining they are
+        # Only neighbours can conflict with var, and their counts are cached per pair
+        others = [self.get_conflict_counts(var, other_var) for other_var in self.neighbours[var]
+                  if other_var not in assignment]
+
         def count_conflicts(value):
-            conflicts = 0
-            for other_var in self.sessions:
-                if other_var != var and other_var not in assignment:
-                    for other_value in self.domains[other_var]:
-                        if not self.is_consistent(var, value, other_var, other_value):
-                            conflicts += 1
-            return conflicts
+            return sum(counts[value] for counts in others)
         
         return sorted(self.domains[var], key=count_conflicts)
 
+    def get_conflict_counts(self, var, other_var):
+        # For each value of var, how many values of other_var are inconsistent with it
+        key = (var, other_var)
+        if key not in self.conflict_counts:
+            same_time, same_slot = self.constraints[var, other_var]
+            other_domain = self.domains[other_var]
+            if same_slot:
+                slot_counts = Counter(time_slot % SLOT_STRIDE for time_slot in other_domain)
+                counts = {value: slot_counts[value % SLOT_STRIDE] for value in self.domains[var]}
+            elif same_time:
+                other_values = set(other_domain)
+                counts = {value: int(value in other_values) for value in self.domains[var]}
+            else:
+                counts = {value: 0 for value in self.domains[var]}
+            self.conflict_counts[key] = counts
+        return self.conflict_counts[key]
+
     def is_value_consistent(self, var, value, assignment):
-        for other_var, other_value in assignment.items():
-            if not self.is_consistent(var, value, other_var, other_value):
+        # Only assigned neighbours can be inconsistent with var
+        for other_var in self.neighbours[var]:
+            other_value = assignment.get(other_var)
+            if other_value is not None and not self.is_consistent(var, value, other_var, other_value):
                 return False
         return True
 
     # C3
-    def check_consecutive_sessions(self, assignment):
-        # Track slots by teacher
-        teacher_slots = {}
-        # Track slots by group
-        group_slots = {}
-        
-        for session, time_slot in assignment.items():
-            # Track by teacher
-            teacher = session.teacher
-            if teacher not in teacher_slots:
-                teacher_slots[teacher] = {}
-            
-            day = time_slot.day
-            if day not in teacher_slots[teacher]:
-                teacher_slots[teacher][day] = []
-            
-            teacher_slots[teacher][day].append(time_slot.slot)
-            
-            # Track by group
-            if session.group:
-                group = session.group
-                if group not in group_slots:
-                    group_slots[group] = {}
-                
-                if day not in group_slots[group]:
-                    group_slots[group][day] = []
-                
-                group_slots[group][day].append(time_slot.slot)
-        
-        # Check teacher consecutive slots
-        for teacher, days in teacher_slots.items():
-            for day, slots in days.items():
-                slots.sort()
-                consecutive = 1
-                for i in range(1, len(slots)):
-                    if slots[i] == slots[i-1] + 1:
-                        consecutive += 1
-                        if consecutive > 3:
-                            return False
-                    else:
-                        consecutive = 1
-        
-        # Check group consecutive slots
-        for group, days in group_slots.items():
-            for day, slots in days.items():
-                slots.sort()
-                consecutive = 1
-                for i in range(1, len(slots)):
-                    if slots[i] == slots[i-1] + 1:
-                        consecutive += 1
-                        if consecutive > 3:
-                            return False
-                    else:
-                        consecutive = 1
-        
-        # Also check for global consecutive slots (students in general)
-        all_slots_by_day = {}
-        for session, time_slot in assignment.items():
-            if session.session_type == "lecture":  # Lectures affect all students
-                day = time_slot.day
-                if day not in all_slots_by_day:
-                    all_slots_by_day[day] = set()
-                all_slots_by_day[day].add(time_slot.slot)
-        
-        # For each group, add their specific sessions
-        for group in group_slots:
-            for day, slots in group_slots[group].items():
-                if day not in all_slots_by_day:
-                    all_slots_by_day[day] = set()
-                for slot in slots:
-                    all_slots_by_day[day].add(slot)
-        
-        # Check for consecutive global slots
-        for day, slots_set in all_slots_by_day.items():
-            slots = sorted(list(slots_set))
-            consecutive = 1
-            for i in range(1, len(slots)):
-                if slots[i] == slots[i-1] + 1:
-                    consecutive += 1
-                    if consecutive > 3:
-                        return False
-                else:
-                    consecutive = 1
-        
+    def occupied_slot_counters(self, session, time_slot):
+        # Slot counters the session counts towards: its teacher's, its group's, and the
+        # day's for every session seen by students (lectures and group sessions)
+        day = time_slot // SLOT_STRIDE
+        counters = [self.teacher_slots.setdefault((session.teacher, day), Counter())]
+        if session.group:
+            counters.append(self.group_slots.setdefault((session.group, day), Counter()))
+        if session.group or session.session_type == "lecture":
+            counters.append(self.day_slots.setdefault(day, Counter()))
+        return counters
+
+    def add_occupied_slot(self, session, time_slot):
+        for slots in self.occupied_slot_counters(session, time_slot):
+            slots[time_slot % SLOT_STRIDE] += 1
+
+    def remove_occupied_slot(self, session, time_slot):
+        for slots in self.occupied_slot_counters(session, time_slot):
+            slots[time_slot % SLOT_STRIDE] -= 1
+
+    def check_consecutive_sessions(self, session, time_slot):
+        # Only the runs through the newly assigned slot can have grown past 3
+        for slots in self.occupied_slot_counters(session, time_slot):
+            first = last = time_slot % SLOT_STRIDE
+            while slots[first - 1] > 0:
+                first -= 1
+            while slots[last + 1] > 0:
+                last += 1
+            if last - first + 1 > 3:
+                return False
         return True
 
     def solve(self):
@@ -287,6 +299,10 @@ class CSPSolver:
         solution = self.backtracking_search()
         
         if solution:
+            solution = {session: self.time_slot(slot_id) for session, slot_id in solution.items()}
+            for session, time_slot in solution.items():
+                session.assigned_slot = time_slot
+
             # Convert solution to a readable timetable
             timetable = {day: {slot: [] for slot in range(1, self.slots_per_day[day] + 1)} for day in self.days}
             
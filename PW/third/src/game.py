@@ -7,31 +7,51 @@ EMPTY = 0
 PLAYER_PIECE = 1
 AI_PIECE = 2
 
+# Bitboard layout: cell (row, col) is bit col * COLUMN_HEIGHT + row. The spare bit on top
+# of every column is never set, so shifted runs of pieces cannot wrap into the next column
+COLUMN_HEIGHT = ROW_COUNT + 1
+COLUMN_MASK = (1 << ROW_COUNT) - 1
+TOP_BITS = [1 << (col * COLUMN_HEIGHT + ROW_COUNT - 1) for col in range(COLUMN_COUNT)]
+# Bit index of every cell, used to unpack a bitboard into an array
+CELL_BITS = np.arange(ROW_COUNT)[:, None] + COLUMN_HEIGHT * np.arange(COLUMN_COUNT)
+# Bit distance between neighbouring cells: vertical, horizontal and both diagonals
+DIRECTIONS = (1, COLUMN_HEIGHT, COLUMN_HEIGHT - 1, COLUMN_HEIGHT + 1)
+
 class GameBoard:
     def __init__(self):
-        self.board = self.create_board()
+        self.mask = 0  # every occupied cell
+        self.pieces = [0, 0]  # occupied cells of PLAYER_PIECE and AI_PIECE
         self.game_over = False
         self.winner = None
         
-    def create_board(self):
-        """Create an empty game board."""
-        board = np.zeros((ROW_COUNT, COLUMN_COUNT))
+    @property
+    def board(self):
+        """The board as a ROW_COUNT x COLUMN_COUNT array, unpacked from the bitboards."""
+        board = np.zeros((ROW_COUNT, COLUMN_COUNT), dtype=np.int8)
+        board[(self.pieces[PLAYER_PIECE-1] >> CELL_BITS) & 1 == 1] = PLAYER_PIECE
+        board[(self.pieces[AI_PIECE-1] >> CELL_BITS) & 1 == 1] = AI_PIECE
         return board
     
     def drop_piece(self, row, col, piece):
         """Place a piece on the board."""
-        self.board[row][col] = piece
+        bit = 1 << (col * COLUMN_HEIGHT + row)
+        self.mask |= bit
+        self.pieces[piece-1] |= bit
+    
+    def remove_piece(self, row, col, piece):
+        """Take back a piece placed with drop_piece."""
+        bit = 1 << (col * COLUMN_HEIGHT + row)
+        self.mask ^= bit
+        self.pieces[piece-1] ^= bit
     
     def is_valid_location(self, col):
         """Check if a column has space for another piece."""
-        return self.board[ROW_COUNT-1][col] == 0
+        return not self.mask & TOP_BITS[col]
     
     def get_next_open_row(self, col):
         """Find the next available row in the given column."""
-        for r in range(ROW_COUNT):
-            if self.board[r][col] == 0:
-                return r
-        return None
+        row = ((self.mask >> (col * COLUMN_HEIGHT)) & COLUMN_MASK).bit_count()
+        return row if row < ROW_COUNT else None
     
     def print_board(self):
         """Print the current board state."""
@@ -39,11 +59,7 @@ class GameBoard:
     
     def get_valid_locations(self):
         """Get all valid column locations for the next move."""
-        valid_locations = []
-        for col in range(COLUMN_COUNT):
-            if self.is_valid_location(col):
-                valid_locations.append(col)
-        return valid_locations
+        return [col for col in range(COLUMN_COUNT) if not self.mask & TOP_BITS[col]]
     
     def is_terminal_node(self):
         """Check if the game has reached a terminal state."""
@@ -51,30 +67,12 @@ class GameBoard:
     
     def winning_move(self, piece):
         """Check if the given piece has a winning configuration on the board."""
-        for c in range(COLUMN_COUNT-3):
-            for r in range(ROW_COUNT):
-                if (self.board[r][c] == piece and self.board[r][c+1] == piece and 
-                    self.board[r][c+2] == piece and self.board[r][c+3] == piece):
-                    return True
-
-        for c in range(COLUMN_COUNT):
-            for r in range(ROW_COUNT-3):
-                if (self.board[r][c] == piece and self.board[r+1][c] == piece and 
-                    self.board[r+2][c] == piece and self.board[r+3][c] == piece):
-                    return True
-
-        for c in range(COLUMN_COUNT-3):
-            for r in range(ROW_COUNT-3):
-                if (self.board[r][c] == piece and self.board[r+1][c+1] == piece and 
-                    self.board[r+2][c+2] == piece and self.board[r+3][c+3] == piece):
-                    return True
-
-        for c in range(COLUMN_COUNT-3):
-            for r in range(3, ROW_COUNT):
-                if (self.board[r][c] == piece and self.board[r-1][c+1] == piece and 
-                    self.board[r-2][c+2] == piece and self.board[r-3][c+3] == piece):
-                    return True
-                    
+        m = self.pieces[piece-1]
+        for shift in DIRECTIONS:
+            # pairs marks every piece followed by another one; two pairs 2 apart make four
+            pairs = m & (m >> shift)
+            if pairs & (pairs >> 2 * shift):
+                return True
         return False
     
     def check_win_or_draw(self, piece):
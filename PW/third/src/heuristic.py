@@ -1,40 +1,29 @@
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from game import ROW_COUNT, COLUMN_COUNT, EMPTY, PLAYER_PIECE, AI_PIECE
 
 WINDOW_LENGTH = 4
 
-def evaluate_window(window, piece):
-    """
-    Evaluate a window of 4 positions for the given piece.
-    
-    Args:
-        window: List of 4 pieces in a row
-        piece: Piece type to evaluate for (PLAYER_PIECE or AI_PIECE)
-        
-    Returns:
-        Score for the window
-    """
-    score = 0
-    opp_piece = PLAYER_PIECE if piece == AI_PIECE else AI_PIECE
-
-    # Score based on piece count and empty spaces
-    if window.count(piece) == 4:
-        score += 100
-    elif window.count(piece) == 3 and window.count(EMPTY) == 1:
-        score += 5
-    elif window.count(piece) == 2 and window.count(EMPTY) == 2:
-        score += 2
-
-    # Penalize opponent's three in a row
-    if window.count(opp_piece) == 3 and window.count(EMPTY) == 1:
-        score -= 4
-
-    return score
+# Flat board indices (row * COLUMN_COUNT + col) of all 69 windows of 4 cells, taken as
+# zero-copy sliding window views of the index grid: horizontal, vertical, and the
+# positive and negative sloped diagonals of every 4x4 block
+CELL_INDICES = np.arange(ROW_COUNT * COLUMN_COUNT).reshape(ROW_COUNT, COLUMN_COUNT)
+_blocks = sliding_window_view(CELL_INDICES, (WINDOW_LENGTH, WINDOW_LENGTH)).reshape(-1, WINDOW_LENGTH, WINDOW_LENGTH)
+WINDOW_INDICES = np.concatenate([
+    sliding_window_view(CELL_INDICES, WINDOW_LENGTH, axis=1).reshape(-1, WINDOW_LENGTH),
+    sliding_window_view(CELL_INDICES, WINDOW_LENGTH, axis=0).transpose(1, 0, 2).reshape(-1, WINDOW_LENGTH),
+    np.diagonal(_blocks, axis1=1, axis2=2),
+    np.diagonal(_blocks[:, ::-1, :], axis1=1, axis2=2),
+])
 
 def score_position(board, piece):
     """
     Score the entire board position for the given piece.
     
+    Every window of 4 positions scores 100 for four pieces, 5 for three pieces
+    and an empty space, 2 for two pieces and two empty spaces, and -4 for three
+    opponent pieces and an empty space.
+    
     Args:
         board: array with the current board state
         piece: Piece type to evaluate for (PLAYER_PIECE or AI_PIECE)
@@ -42,36 +31,22 @@ def score_position(board, piece):
     Returns:
         Score for the position
     """
-    score = 0
-
-    center_array = [int(i) for i in list(board[:, COLUMN_COUNT//2])]
-    center_count = center_array.count(piece)
-    score += center_count * 3
+    opp_piece = PLAYER_PIECE if piece == AI_PIECE else AI_PIECE
 
-    # Score Horizontal
-    for r in range(ROW_COUNT):
-        row_array = [int(i) for i in list(board[r,:])]
-        for c in range(COLUMN_COUNT-3):
-            window = row_array[c:c+WINDOW_LENGTH]
-            score += evaluate_window(window, piece)
+    center_count = np.count_nonzero(board[:, COLUMN_COUNT//2] == piece)
+    score = center_count * 3
 
-    # Score Vertical
-    for c in range(COLUMN_COUNT):
-        col_array = [int(i) for i in list(board[:,c])]
-        for r in range(ROW_COUNT-3):
-            window = col_array[r:r+WINDOW_LENGTH]
-            score += evaluate_window(window, piece)
+    # Score all windows at once: one row of 4 cells per window
+    windows = board.ravel()[WINDOW_INDICES]
+    piece_counts = np.count_nonzero(windows == piece, axis=1)
+    empty_counts = np.count_nonzero(windows == EMPTY, axis=1)
+    opp_counts = np.count_nonzero(windows == opp_piece, axis=1)
 
-    # Score positive sloped diagonal
-    for r in range(ROW_COUNT-3):
-        for c in range(COLUMN_COUNT-3):
-            window = [board[r+i][c+i] for i in range(WINDOW_LENGTH)]
-            score += evaluate_window(window, piece)
+    score += 100 * np.count_nonzero(piece_counts == 4)
+    score += 5 * np.count_nonzero((piece_counts == 3) & (empty_counts == 1))
+    score += 2 * np.count_nonzero((piece_counts == 2) & (empty_counts == 2))
 
-    # Score negative sloped diagonal
-    for r in range(ROW_COUNT-3):
-        for c in range(COLUMN_COUNT-3):
-            window = [board[r+3-i][c+i] for i in range(WINDOW_LENGTH)]
-            score += evaluate_window(window, piece)
+    # Penalize opponent's three in a row
+    score -= 4 * np.count_nonzero((opp_counts == 3) & (empty_counts == 1))
 
-    return score
\ No newline at end of file
+    return int(score)
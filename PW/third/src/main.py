@@ -20,41 +20,61 @@ TITLE_HEIGHT = 80
 WIDTH = COLUMN_COUNT * SQUARESIZE 
 HEIGHT = ((ROW_COUNT+1) * SQUARESIZE + TITLE_HEIGHT) 
 
+# Strip above the board where the next piece follows the mouse
+PREVIEW_RECT = pygame.Rect(0, TITLE_HEIGHT, WIDTH, SQUARESIZE)
+# Frame rate cap for the event loop
+FPS = 60
+
+# Title bar, board and empty holes never change, so they are rendered once by
+# get_background and blitted by draw_board instead of being redrawn cell by cell
+_background = None
+
+def get_background():
+    global _background
+    if _background is None:
+        background = pygame.Surface((WIDTH, HEIGHT)).convert()
+        
+        # title bar
+        pygame.draw.rect(background, DARK_GRAY, (0, 0, WIDTH, TITLE_HEIGHT))
+        
+        # area background
+        pygame.draw.rect(background, NAVY, (0, TITLE_HEIGHT, WIDTH, HEIGHT - TITLE_HEIGHT))
+        
+        #  grid 
+        for c in range(COLUMN_COUNT):
+            for r in range(ROW_COUNT):
+                rect_x = c * SQUARESIZE
+                rect_y = r * SQUARESIZE + TITLE_HEIGHT + SQUARESIZE
+                pygame.draw.rect(background, NAVY, (rect_x, rect_y, SQUARESIZE, SQUARESIZE))
+                
+                circle_x = rect_x + SQUARESIZE//2
+                circle_y = rect_y + SQUARESIZE//2
+                pygame.draw.circle(background, DARK_GRAY, (circle_x, circle_y), RADIUS)
+                pygame.draw.circle(background, WHITE, (circle_x, circle_y), RADIUS - BORDER_WIDTH)
+        
+        title_font = pygame.font.SysFont("Arial", 36, bold=True)
+        title = title_font.render("CONNECT FOUR", True, WHITE)
+        background.blit(title, (WIDTH//2 - title.get_width()//2, TITLE_HEIGHT//2 - title.get_height()//2))
+        _background = background
+    return _background
+
 def draw_board(screen, game_board):
-    # title bar
-    pygame.draw.rect(screen, DARK_GRAY, (0, 0, WIDTH, TITLE_HEIGHT))
-    
-    # area background
-    pygame.draw.rect(screen, NAVY, (0, TITLE_HEIGHT, WIDTH, HEIGHT - TITLE_HEIGHT))
-    
-    #  grid 
-    for c in range(COLUMN_COUNT):
-        for r in range(ROW_COUNT):
-            rect_x = c * SQUARESIZE
-            rect_y = r * SQUARESIZE + TITLE_HEIGHT + SQUARESIZE
-            pygame.draw.rect(screen, NAVY, (rect_x, rect_y, SQUARESIZE, SQUARESIZE))
-            
-            circle_x = rect_x + SQUARESIZE//2
-            circle_y = rect_y + SQUARESIZE//2
-            pygame.draw.circle(screen, DARK_GRAY, (circle_x, circle_y), RADIUS)
-            pygame.draw.circle(screen, WHITE, (circle_x, circle_y), RADIUS - BORDER_WIDTH)
+    screen.blit(get_background(), (0, 0))
     
+    # pieces
+    board = game_board.board
     for c in range(COLUMN_COUNT):
         for r in range(ROW_COUNT):
             circle_x = c * SQUARESIZE + SQUARESIZE//2
             circle_y = HEIGHT - (r * SQUARESIZE + SQUARESIZE//2)
             
-            if game_board.board[r][c] == PLAYER_PIECE:
+            if board[r][c] == PLAYER_PIECE:
                 pygame.draw.circle(screen, ORANGE, (circle_x, circle_y), RADIUS)
                 pygame.draw.circle(screen, (255, 140, 50), (circle_x, circle_y), RADIUS - 5)
-            elif game_board.board[r][c] == AI_PIECE:
+            elif board[r][c] == AI_PIECE:
                 pygame.draw.circle(screen, LIGHT_BLUE, (circle_x, circle_y), RADIUS)
                 pygame.draw.circle(screen, (100, 180, 255), (circle_x, circle_y), RADIUS - 5)
     
-    title_font = pygame.font.SysFont("Arial", 36, bold=True)
-    title = title_font.render("CONNECT FOUR", True, WHITE)
-    screen.blit(title, (WIDTH//2 - title.get_width()//2, TITLE_HEIGHT//2 - title.get_height()//2))
-    
     pygame.display.update()
 
 def show_winner_message(screen, winner):
@@ -85,7 +105,6 @@ def main():
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     
     game_board = GameBoard()
-    game_board.print_board()
     game_over = False
     winner = None
     
@@ -97,20 +116,18 @@ def main():
     
     human_player = HumanPlayer(PLAYER_PIECE)
     ai_player = AIPlayer(AI_PIECE, difficulty=5)
+    clock = pygame.time.Clock()
     
     while True:
+        # Mouse moves are coalesced: only the latest position of each frame is drawn
+        preview_x = None
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
                 
             if event.type == pygame.MOUSEMOTION and not game_over:
-                pygame.draw.rect(screen, DARK_GRAY, (0, TITLE_HEIGHT, WIDTH, SQUARESIZE))
-                posx = event.pos[0]
-                
-                if turn == PLAYER:
-                    pygame.draw.circle(screen, ORANGE, (posx, TITLE_HEIGHT + SQUARESIZE//2), RADIUS)
-                    pygame.display.update()
+                preview_x = event.pos[0]
                     
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if game_over:
@@ -133,12 +150,19 @@ def main():
                             game_over, winner = game_board.check_win_or_draw(PLAYER_PIECE)
                             
                             turn = (turn + 1) % 2
-                            game_board.print_board()
                             draw_board(screen, game_board)
                             
                             if game_over:
                                 show_winner_message(screen, winner)
         
+        # Only the preview strip changes, so only that part of the screen is updated
+        if preview_x is not None and not game_over:
+            pygame.draw.rect(screen, DARK_GRAY, PREVIEW_RECT)
+            
+            if turn == PLAYER:
+                pygame.draw.circle(screen, ORANGE, (preview_x, TITLE_HEIGHT + SQUARESIZE//2), RADIUS)
+                pygame.display.update(PREVIEW_RECT)
+        
         # AI's turn
         if turn == AI and not game_over:
             pygame.draw.rect(screen, DARK_GRAY, (0, TITLE_HEIGHT, WIDTH, SQUARESIZE))
@@ -160,11 +184,12 @@ def main():
                 game_over, winner = game_board.check_win_or_draw(AI_PIECE)
                 
                 turn = (turn + 1) % 2
-                game_board.print_board()
                 draw_board(screen, game_board)
                 
                 if game_over:
                     show_winner_message(screen, winner)
+        
+        clock.tick(FPS)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
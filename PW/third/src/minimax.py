@@ -1,8 +1,19 @@
 import random
 import math
-from game import PLAYER_PIECE, AI_PIECE
+from game import PLAYER_PIECE, AI_PIECE, COLUMN_COUNT
 from heuristic import score_position
 
+# Columns from the centre outwards: central moves are usually strongest, and trying
+# good moves first lets alpha-beta prune sooner
+COL_ORDER = tuple(sorted(range(COLUMN_COUNT), key=lambda col: abs(col - COLUMN_COUNT//2)))
+
+# Kinds of score stored in the transposition table
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+# Results of earlier searches, keyed by position and side to move, as
+# (depth, bound kind, score, best column). AIPlayer clears it before every move
+transposition_table = {}
+
 def minimax(game, depth, alpha, beta, maximizing_player):
     """
     Minimax algorithm with alpha-beta pruning implementation.
@@ -17,19 +28,43 @@ def minimax(game, depth, alpha, beta, maximizing_player):
     Returns:
         Tuple of (best column, score)
     """
-    valid_locations = game.get_valid_locations()
-    is_terminal = game.is_terminal_node()
+    # The two bitboards identify the position, so they serve directly as the table key
+    key = (game.mask, game.pieces[AI_PIECE-1], maximizing_player)
+    entry = transposition_table.get(key)
+    if entry is not None and entry[0] >= depth:
+        _, bound, value, column = entry
+        if bound == EXACT:
+            return column, value
+        if bound == LOWER_BOUND:
+            alpha = max(alpha, value)
+        else:
+            beta = min(beta, value)
+        if alpha >= beta:
+            return column, value
+    alpha_orig, beta_orig = alpha, beta
+    
+    valid_locations = [col for col in COL_ORDER if game.is_valid_location(col)]
+    # Try the best move found by an earlier search of this position first
+    if entry is not None and entry[3] in valid_locations:
+        valid_locations.remove(entry[3])
+        valid_locations.insert(0, entry[3])
+    # Check each side for a win once; is_terminal_node would repeat these checks
+    ai_wins = game.winning_move(AI_PIECE)
+    player_wins = not ai_wins and game.winning_move(PLAYER_PIECE)
+    is_terminal = ai_wins or player_wins or not valid_locations
     
     if depth == 0 or is_terminal:
         if is_terminal:
-            if game.winning_move(AI_PIECE):
-                return (None, 100000000000000)
-            elif game.winning_move(PLAYER_PIECE):
-                return (None, -10000000000000)
+            if ai_wins:
+                value = 100000000000000
+            elif player_wins:
+                value = -10000000000000
             else:  
-                return (None, 0)
+                value = 0
         else:  
-            return (None, score_position(game.board, AI_PIECE))
+            value = score_position(game.board, AI_PIECE)
+        transposition_table[key] = (depth, EXACT, value, None)
+        return None, value
     
     if maximizing_player:
         value = -math.inf
@@ -37,12 +72,10 @@ def minimax(game, depth, alpha, beta, maximizing_player):
         for col in valid_locations:
             row = game.get_next_open_row(col)
             if row is not None:  # Check if row is not None
-                # Create a copy of the board and make the move
-                temp_game = copy_game_state(game)
-                temp_game.drop_piece(row, col, AI_PIECE)
-                
-                # Recursive minimax call
-                new_score = minimax(temp_game, depth-1, alpha, beta, False)[1]
+                # Make the move, search it, then take it back
+                game.drop_piece(row, col, AI_PIECE)
+                new_score = minimax(game, depth-1, alpha, beta, False)[1]
+                game.remove_piece(row, col, AI_PIECE)
                 
                 # Update best move if better score found
                 if new_score > value:
@@ -53,8 +86,6 @@ def minimax(game, depth, alpha, beta, maximizing_player):
                 alpha = max(alpha, value)
                 if alpha >= beta:
                     break
-                    
-        return column, value
     
     else: 
         value = math.inf
@@ -62,12 +93,10 @@ def minimax(game, depth, alpha, beta, maximizing_player):
         for col in valid_locations:
             row = game.get_next_open_row(col)
             if row is not None:  
-                # Create a copy of the board and make the move
-                temp_game = copy_game_state(game)
-                temp_game.drop_piece(row, col, PLAYER_PIECE)
-                
-                # Recursive minimax call
-                new_score = minimax(temp_game, depth-1, alpha, beta, True)[1]
+                # Make the move, search it, then take it back
+                game.drop_piece(row, col, PLAYER_PIECE)
+                new_score = minimax(game, depth-1, alpha, beta, True)[1]
+                game.remove_piece(row, col, PLAYER_PIECE)
                 
                 # Update best move if better score found
                 if new_score < value:
@@ -78,14 +107,14 @@ def minimax(game, depth, alpha, beta, maximizing_player):
                 beta = min(beta, value)
                 if alpha >= beta:
                     break
-                    
-        return column, value
+    
+    # A score outside the search window is only a bound on the true score
+    if value <= alpha_orig:
+        bound = UPPER_BOUND
+    elif value >= beta_orig:
+        bound = LOWER_BOUND
+    else:
+        bound = EXACT
+    transposition_table[key] = (depth, bound, value, column)
+    return column, value
 
-def copy_game_state(game):
-    """Create a copy of the game state to avoid modifying the original."""
-    from game import GameBoard
-    new_game = GameBoard()
-    new_game.board = game.board.copy()
-    new_game.game_over = game.game_over
-    new_game.winner = game.winner
-    return new_game
\ No newline at end of file
@@ -4,6 +4,9 @@ from abc import ABC, abstractmethod
 PLAYER = 0
 AI = 1
 
+# Half-width of the score window AIPlayer searches around the previous depth's score
+ASPIRATION_WINDOW = 50
+
 class Player(ABC):
     """Abstract base class for all player types."""
     
@@ -33,8 +36,22 @@ class AIPlayer(Player):
     
     def get_move(self, game):
         """Get the best column to drop a piece using minimax algorithm."""
-        from minimax import minimax
+        from minimax import minimax, transposition_table
         import math
         
-        col, _ = minimax(game, self.difficulty, -math.inf, math.inf, True)
+        transposition_table.clear()
+        # Iterative deepening: every pass leaves its best moves in the transposition table,
+        # where the next, deeper pass tries them first
+        col, score = None, 0
+        for depth in range(1, self.difficulty + 1):
+            # Expect a score close to the previous pass and search a narrow window around it
+            if depth == 1:
+                alpha, beta = -math.inf, math.inf
+            else:
+                alpha, beta = score - ASPIRATION_WINDOW, score + ASPIRATION_WINDOW
+            col, score = minimax(game, depth, alpha, beta, True)
+            
+            # Outside the window the score is only a bound, so search again in full
+            if score <= alpha or score >= beta:
+                col, score = minimax(game, depth, -math.inf, math.inf, True)
         return col
\ No newline at end of file